@@ -2,32 +2,43 @@ from flask import Flask
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 from config import Config
+from utils.json_provider import ORJSONProvider
 import os
 
 # Importa os blueprints
 from routes.game_routes import game_bp
 from routes.auth_routes import auth_bp
 
-app = Flask(__name__)
+def create_app(config=Config):
+    """Cria e configura a aplicação Flask (app factory)."""
+    app = Flask(__name__)
+    app.json = ORJSONProvider(app)
 
-print("--- APLICAÇÃO INICIADA COM SUCESSO (VERSÃO COM LOGS) ---")
+    # Configurações do Flask e JWT a partir da classe Config
+    app.config.from_object(config)
+    JWTManager(app)
 
-# Configurações do Flask e JWT a partir da classe Config
-app.config["JWT_SECRET_KEY"] = Config.JWT_SECRET_KEY
-jwt = JWTManager(app)
+    # Configurações para o CORS (para o frontend funcionar)
+    # max_age permite ao navegador reaproveitar o preflight (OPTIONS) por 2h,
+    # que é o teto efetivo do Chromium.
+    CORS(app, resources={r"/api/*": {"origins": "*", "max_age": 7200}})
 
-# Configurações para o CORS (para o frontend funcionar)
-CORS(app, resources={r"/api/*": {"origins": "*"}})
+    # Registra os blueprints
+    app.register_blueprint(auth_bp, url_prefix='/api')
+    app.register_blueprint(game_bp, url_prefix='/api/games')
 
-# Registra os blueprints
-app.register_blueprint(auth_bp, url_prefix='/api')
-app.register_blueprint(game_bp, url_prefix='/api/games')
+    @app.route('/')
+    def index():
+        return "API de Jogos está no ar!"
 
-@app.route('/')
-def index():
-    return "API de Jogos está no ar!"
+    print("--- APLICAÇÃO INICIADA COM SUCESSO (VERSÃO COM LOGS) ---")
+    return app
+
+# Instância usada pelo Gunicorn (app:app)
+app = create_app()
 
 if __name__ == '__main__':
-    # A porta padrão do Render para Gunicorn é 8000
+    # Servidor de desenvolvimento apenas para uso local.
+    # Em produção a aplicação roda via Gunicorn (ver gunicorn.conf.py).
     port = int(os.environ.get('PORT', 8000))
-    app.run(host='0.0.0.0', port=port, debug=True)
+    app.run(host='0.0.0.0', port=port, debug=os.environ.get('FLASK_DEBUG') == '1')
@@ -3,6 +3,12 @@ from werkzeug.security import generate_password_hash
 
 class Config:
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'seu-segredo-de-desenvolvimento')
+    # O frontend só envia o token no header "Authorization: Bearer ...";
+    # fixar isso evita a busca em cookies/query string (e o CSRF de cookies) a cada requisição.
+    JWT_TOKEN_LOCATION = ['headers']
+    JWT_HEADER_NAME = 'Authorization'
+    JWT_HEADER_TYPE = 'Bearer'
+    JWT_DECODE_ALGORITHMS = ['HS256']
 
     # A variável de ambiente GOOGLE_SHEETS_CREDENTIALS será lida como uma string JSON
     GOOGLE_SHEETS_CREDENTIALS_JSON = os.environ.get('GOOGLE_SHEETS_CREDENTIALS')
@@ -21,7 +27,10 @@ class Config:
     )
 
     ADMIN_USERNAME = os.environ.get('ADMIN_USERNAME', 'admin')
-    ADMIN_PASSWORD_HASH = os.environ.get('ADMIN_PASSWORD_HASH', generate_password_hash('suasenha_padrao'))
+    # O hash padrão só é gerado quando a variável não existe: como argumento default
+    # do os.environ.get ele rodaria o PBKDF2 em toda importação (boot de cada worker).
+    _env_password_hash = os.environ.get('ADMIN_PASSWORD_HASH')
+    ADMIN_PASSWORD_HASH = _env_password_hash if _env_password_hash else generate_password_hash('suasenha_padrao')
 
     RAWG_API_KEY = os.environ.get('RAWG_API_KEY')
     DEEPL_API_KEY = os.environ.get('DEEPL_API_KEY')
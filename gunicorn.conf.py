@@ -0,0 +1,26 @@
+import os
+
+# Configuração do Gunicorn para produção (Render).
+# Uso: gunicorn -c gunicorn.conf.py app:app
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# As rotas passam a maior parte do tempo esperando o Google Sheets e APIs externas,
+# então usamos workers com threads (gthread) em vez de workers síncronos.
+# IMPORTANTE: todos os caches do services/game_service.py (dados das abas, índice de
+# linhas, payload do dashboard, notificações já enviadas) vivem na memória do processo.
+# Com mais de um worker, uma escrita só invalida o cache do worker que a atendeu e os
+# outros continuam servindo dados e números de linha antigos. Por isso o padrão é um
+# único worker e a concorrência vem das threads; só aumente WEB_CONCURRENCY junto com
+# um cache compartilhado (ex.: Redis).
+workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 16))
+
+timeout = 60
+keepalive = 5
+
+# Carrega a aplicação uma única vez no processo mestre e só depois faz o fork dos workers
+# (páginas de memória compartilhadas via copy-on-write). Os clientes do Google Sheets
+# são criados sob demanda na primeira requisição, portanto cada worker tem o seu.
+preload_app = True
@@ -2,23 +2,49 @@ from flask import Blueprint, request, jsonify
 from werkzeug.security import check_password_hash
 from flask_jwt_extended import create_access_token
 from config import Config
+import hashlib
+import time
 
 auth_bp = Blueprint('auth', __name__)
 
+# --- Cache de logins válidos ---
+# Evita refazer o PBKDF2 (dezenas de ms de CPU) a cada login repetido.
+# Só guardamos resultados positivos, para não ajudar quem tenta adivinhar a senha.
+_login_cache = {}
+_login_cache_ttl_seconds = 60 # Senhas trocadas passam a valer em até 1 minuto
+_login_cache_max_size = 256
+
+def _check_credentials(username, password):
+    """Verifica usuário e senha, usando cache apenas para credenciais válidas."""
+    cache_key = hashlib.sha256(f"{username}\x00{password}".encode()).digest()
+    now = time.time()
+    if _login_cache.get(cache_key, 0) > now:
+        return True
+
+    is_valid = username == Config.ADMIN_USERNAME and check_password_hash(Config.ADMIN_PASSWORD_HASH, password)
+    if is_valid:
+        if len(_login_cache) >= _login_cache_max_size:
+            _login_cache.clear()
+        _login_cache[cache_key] = now + _login_cache_ttl_seconds
+    return is_valid
+
 @auth_bp.route('/login', methods=['POST'])
 def login():
     """
     Recebe username e senha, verifica as credenciais e retorna um token JWT.
     """
-    username = request.json.get('username', None)
-    password = request.json.get('password', None)
+    data = request.get_json(cache=True, silent=True) or {}
+    username = data.get('username', None)
+    password = data.get('password', None)
+    if not username or not password:
+        return jsonify({"msg": "Usuário e senha são obrigatórios."}), 401
 
     # Verifica se as variáveis de ambiente foram configuradas
     if not Config.ADMIN_USERNAME or not Config.ADMIN_PASSWORD_HASH:
         return jsonify({"msg": "Servidor não configurado para autenticação."}), 500
 
     # Compara o usuário fornecido e a senha (usando o hash seguro)
-    if username == Config.ADMIN_USERNAME and check_password_hash(Config.ADMIN_PASSWORD_HASH, password):
+    if _check_credentials(username, password):
         access_token = create_access_token(identity=username)
         return jsonify(access_token=access_token)
     
@@ -1,51 +1,112 @@
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required
+from functools import wraps
 from services import game_service
 import traceback
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+import time
 from config import Config
 from services.game_service import GENRE_TRANSLATIONS
 
 game_bp = Blueprint('games', __name__)
 
-GENRE_TRANSLATIONS = {
-    "Action": "Ação", "Indie": "Indie", "Adventure": "Aventura",
-    "RPG": "RPG", "Strategy": "Estratégia", "Shooter": "Tiro",
-    "Casual": "Casual", "Simulation": "Simulação", "Puzzle": "Puzzle",
-    "Arcade": "Arcade", "Platformer": "Plataforma", "Racing": "Corrida",
-    "Massively Multiplayer": "MMO", "Sports": "Esportes", "Fighting": "Luta",
-    "Family": "Família", "Board Games": "Jogos de Tabuleiro", "Educational": "Educacional",
-    "Card": "Cartas"
-}
+_translate_genre = GENRE_TRANSLATIONS.get
+
+# Sessão HTTP reaproveitada entre requisições: mantém a conexão TLS com a RAWG aberta
+_rawg_session = requests.Session()
+_rawg_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=1))
+
+# Limite de tamanho da resposta da RAWG (page_size=5 fica bem abaixo disso)
+_rawg_max_response_bytes = 2 * 1024 * 1024
+
+def _read_limited_body(response, max_bytes):
+    """Lê o corpo de uma resposta em streaming, abortando se passar de max_bytes."""
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        body.extend(chunk)
+        if len(body) > max_bytes:
+            raise requests.exceptions.RequestException("Resposta da API externa excede o tamanho máximo permitido.")
+    return bytes(body)
+
+def validate_body(schema=None):
+    """
+    Decorator que faz o parse do corpo JSON uma única vez e o entrega à rota como
+    primeiro argumento. Responde 400 antes de tocar no Google Sheets se o corpo
+    não for um objeto JSON ou se algum campo do schema ({campo: tipo}) faltar ou
+    tiver outro tipo. Valores "falsos" (0, '', []) e o objeto vazio {} são aceitos;
+    cada rota decide se precisa de conteúdo.
+    """
+    schema = schema or {}
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            data = request.get_json(cache=True, silent=True)
+            if not isinstance(data, dict):
+                return jsonify({"success": False, "message": "Corpo da requisição ausente ou inválido."}), 400
+            invalid_fields = [
+                field for field, field_type in schema.items()
+                if field not in data or not isinstance(data[field], field_type)
+            ]
+            if invalid_fields:
+                return jsonify({"success": False, "message": f"Campos ausentes ou inválidos: {', '.join(invalid_fields)}."}), 400
+            return view(data, *args, **kwargs)
+        return wrapper
+    return decorator
+
+# Funções do serviço por tipo de lista, usadas pelas rotas de adicionar/editar/deletar
+_ADD_BY_LIST_TYPE = {'games': game_service.add_game_to_sheet, 'wishlist': game_service.add_wish_to_sheet}
+_EDIT_BY_LIST_TYPE = {'games': game_service.update_game_in_sheet, 'wishlist': game_service.update_wish_in_sheet}
+_DELETE_BY_LIST_TYPE = {'games': game_service.delete_game_from_sheet, 'wishlist': game_service.delete_wish_from_sheet}
+
+# --- Cache das buscas na RAWG ---
+# Chave: termo de busca normalizado. Valor: (resultados, instante da busca).
+_search_cache = {}
+_search_cache_ttl_seconds = 3600
+_search_cache_max_size = 2048
 
 @game_bp.route('/search-external', methods=['GET'])
 @jwt_required()
 def search_external_games():
-    query = request.args.get('query', '')
+    query = request.args.get('query', '').strip()
     if not query or len(query) < 3:
         return jsonify({"error": "A busca deve ter pelo menos 3 caracteres."}), 400
 
     if not Config.RAWG_API_KEY:
         return jsonify({"error": "Chave da API externa não configurada no servidor."}), 500
 
+    cache_key = query.lower()
+    cached = _search_cache.get(cache_key)
+    if cached and time.time() - cached[1] < _search_cache_ttl_seconds:
+        return jsonify(cached[0])
+
     try:
-        url = f"https://api.rawg.io/api/games?key={Config.RAWG_API_KEY}&search={query}&page_size=5"
-        response = requests.get(url)
-        response.raise_for_status()
-        rawg_data = response.json()
+        # params= faz o URL-encoding da busca (ex.: "a&b", acentos)
+        params = {'key': Config.RAWG_API_KEY, 'search': query, 'page_size': 5}
+        with _rawg_session.get("https://api.rawg.io/api/games", params=params, timeout=(3, 10), stream=True) as response:
+            response.raise_for_status()
+            rawg_data = orjson.loads(_read_limited_body(response, _rawg_max_response_bytes))
 
         results = []
         for game in rawg_data.get('results', []):
-            genres_pt = [GENRE_TRANSLATIONS.get(g['name'], g['name']) for g in game.get('genres', [])]
+            # Gêneros traduzidos, sem repetição (ex.: dois gêneros que viram o mesmo termo)
+            genres_pt = []
+            seen_genres = set()
+            for g in game.get('genres') or ():
+                genre = _translate_genre(g['name'], g['name'])
+                if genre not in seen_genres:
+                    seen_genres.add(genre)
+                    genres_pt.append(genre)
             
-            game_tags = game.get('tags') or []
-            
-            for tag in game_tags:
-                if tag.get('language') == 'eng' and tag.get('slug') == 'souls-like':
-                    soulslike_tag_name = tag.get('name')
-                    if soulslike_tag_name and soulslike_tag_name not in genres_pt:
-                        genres_pt.append("Soulslike")
-                    break
+            game_tags = game.get('tags') or ()
+            is_soulslike = any(
+                tag.get('slug') == 'souls-like' and tag.get('language') == 'eng' and tag.get('name')
+                for tag in game_tags
+            )
+            if is_soulslike and "Soulslike" not in seen_genres:
+                genres_pt.append("Soulslike")
 
             release_date = game.get('released')
             
@@ -57,6 +118,9 @@ def search_external_games():
                 'styles': ', '.join(genres_pt)
             })
             
+        if len(_search_cache) >= _search_cache_max_size:
+            _search_cache.clear()
+        _search_cache[cache_key] = (results, time.time())
         return jsonify(results)
 
     except requests.exceptions.RequestException as e:
@@ -79,7 +143,10 @@ def get_dashboard_data():
         data['perfil']['headerBackgroundUrl'] = profile_data.get('headerBackgroundUrl', '')
         data['perfil']['headerBackgroundName'] = profile_data.get('headerBackgroundName', '')
         
-        return jsonify(data)
+        # ETag permite ao frontend revalidar com If-None-Match e receber 304 sem corpo
+        response = jsonify(data)
+        response.add_etag()
+        return response.make_conditional(request)
     except Exception as e:
         return jsonify({"error": "Não foi possível obter os dados.", "detalhes_tecnicos": str(e)}), 500
 
@@ -94,10 +161,10 @@ def get_public_profile():
 
 @game_bp.route('/profile/edit', methods=['PUT'])
 @jwt_required()
-def edit_profile():
+@validate_body()
+def edit_profile(data):
     """Edita os dados do perfil."""
     try:
-        data = request.json
         result = game_service.update_profile_in_sheet(data)
         return jsonify(result)
     except Exception as e:
@@ -105,40 +172,47 @@ def edit_profile():
 
 @game_bp.route('/add', methods=['POST'])
 @jwt_required()
-def add_new_item():
+@validate_body({'list_type': str, 'item_data': dict})
+def add_new_item(data):
     """Adiciona um novo jogo ou item de desejo."""
     try:
-        data = request.json
-        list_type = data.get('list_type')
-        item_data = data.get('item_data')
+        list_type = data['list_type']
+        item_data = data['item_data']
         
-        if list_type == 'games':
-            result = game_service.add_game_to_sheet(item_data)
-        elif list_type == 'wishlist':
-            result = game_service.add_wish_to_sheet(item_data)
-        else:
+        add_fn = _ADD_BY_LIST_TYPE.get(list_type)
+        if add_fn is None:
             return jsonify({"success": False, "message": "Tipo de lista inválido."}), 400
-        return jsonify(result)
+        return jsonify(add_fn(item_data))
     except Exception as e:
         return jsonify({"success": False, "message": "Erro ao adicionar item.", "detalhes_tecnicos": str(e)}), 500
 
+@game_bp.route('/add-bulk', methods=['POST'])
+@jwt_required()
+@validate_body({'games': list})
+def add_games_bulk(data):
+    """Adiciona vários jogos à biblioteca em uma única escrita na planilha."""
+    try:
+        games = data['games']
+        if not all(isinstance(game, dict) for game in games):
+            return jsonify({"success": False, "message": "Lista de jogos inválida."}), 400
+        return jsonify(game_service.add_games_to_sheet(games))
+    except Exception as e:
+        return jsonify({"success": False, "message": "Erro ao adicionar jogos.", "detalhes_tecnicos": str(e)}), 500
+
 @game_bp.route('/edit', methods=['PUT'])
 @jwt_required()
-def edit_item():
+@validate_body({'list_type': str, 'item_name': str, 'updated_data': dict})
+def edit_item(data):
     """Edita um jogo ou item de desejo existente."""
     try:
-        data = request.json
-        list_type = data.get('list_type')
-        item_name = data.get('item_name')
-        updated_data = data.get('updated_data')
+        list_type = data['list_type']
+        item_name = data['item_name']
+        updated_data = data['updated_data']
         
-        if list_type == 'games':
-            result = game_service.update_game_in_sheet(item_name, updated_data)
-        elif list_type == 'wishlist':
-            result = game_service.update_wish_in_sheet(item_name, updated_data)
-        else:
+        edit_fn = _EDIT_BY_LIST_TYPE.get(list_type)
+        if edit_fn is None:
             return jsonify({"success": False, "message": "Tipo de lista inválido."}), 400
-        return jsonify(result)
+        return jsonify(edit_fn(item_name, updated_data))
     except Exception as e:
         return jsonify({"success": False, "message": "Erro ao editar item.", "detalhes_tecnicos": str(e)}), 500
 
@@ -152,18 +226,28 @@ def purchase_wish_item(item_name):
     except Exception as e:
         return jsonify({"success": False, "message": "Erro ao marcar item como comprado.", "detalhes_tecnicos": str(e)}), 500
         
+@game_bp.route('/delete-bulk', methods=['POST'])
+@jwt_required()
+@validate_body({'games': list})
+def delete_games_bulk(data):
+    """Remove vários jogos da biblioteca em uma única escrita na planilha."""
+    try:
+        games = data['games']
+        if not all(isinstance(game_name, str) and game_name for game_name in games):
+            return jsonify({"success": False, "message": "Lista de jogos inválida."}), 400
+        return jsonify(game_service.delete_games_from_sheet(games))
+    except Exception as e:
+        return jsonify({"success": False, "message": "Erro ao deletar jogos.", "detalhes_tecnicos": str(e)}), 500
+
 @game_bp.route('/delete/<list_type>/<string:item_name>', methods=['DELETE'])
 @jwt_required()
 def delete_item(list_type, item_name):
     """Deleta um jogo ou item de desejo."""
     try:
-        if list_type == 'games':
-            result = game_service.delete_game_from_sheet(item_name)
-        elif list_type == 'wishlist':
-            result = game_service.delete_wish_from_sheet(item_name)
-        else:
+        delete_fn = _DELETE_BY_LIST_TYPE.get(list_type)
+        if delete_fn is None:
             return jsonify({"success": False, "message": "Tipo de lista inválido."}), 400
-        return jsonify(result)
+        return jsonify(delete_fn(item_name))
     except Exception as e:
         return jsonify({"success": False, "message": "Erro ao deletar item.", "detalhes_tecnicos": str(e)}), 500
 
@@ -283,13 +367,14 @@ def get_steam_library_route():
 
 @game_bp.route('/steam/sync', methods=['POST'])
 @jwt_required()
-def sync_steam_games_route():
+@validate_body()
+def sync_steam_games_route(data):
     """
     Endpoint para receber a lista de jogos a serem sincronizados.
     """
     try:
-        games_to_sync = request.json.get('games', [])
-        if not games_to_sync:
+        games_to_sync = data.get('games', [])
+        if not games_to_sync or not isinstance(games_to_sync, list):
             return jsonify({"success": False, "message": "Nenhum jogo selecionado."}), 400
         
         result = game_service.sync_steam_games(games_to_sync)
@@ -1,20 +1,29 @@
 import gspread
-import pandas as pd
 import json
-import math
+import hashlib
+from bisect import bisect_right
+from gspread.utils import numericise_all
 from oauth2client.service_account import ServiceAccountCredentials
 from config import Config
 from datetime import datetime, timedelta
-import traceback
+import logging
 import requests
 import deepl
 import pytz
 import os
-import random
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+import time
 
-GENRE_TRANSLATIONS = {
+logger = logging.getLogger(__name__)
+
+# Somente leitura: qualquer tentativa de alterar a tabela em outro módulo levanta erro.
+GENRE_TRANSLATIONS = MappingProxyType({
     "Action": "Ação", "Indie": "Indie", "Adventure": "Aventura",
     "RPG": "RPG", "Strategy": "Estratégia", "Shooter": "Tiro",
     "Casual": "Casual", "Simulation": "Simulação", "Puzzle": "Puzzle",
@@ -22,7 +31,7 @@ GENRE_TRANSLATIONS = {
     "Massively Multiplayer": "MMO", "Sports": "Esportes", "Fighting": "Luta",
     "Family": "Família", "Board Games": "Jogos de Tabuleiro", "Educational": "Educacional",
     "Card": "Cartas"
-}
+})
 
 def _normalize_name(name):
     """
@@ -61,57 +70,255 @@ def _normalize_name(name):
     
     return name
 
+# Sessão HTTP da API da Steam: as buscas de conquistas rodam em até 20 threads,
+# então o pool comporta 20 conexões keep-alive reaproveitadas entre chamadas.
+_steam_session = requests.Session()
+_steam_session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=20))
+_steam_session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=20))
+
+# Sessão HTTP da RAWG: mantém a conexão TLS aberta entre as chamadas. As buscas de
+# imagens dos similares rodam em até 10 threads, então o pool comporta 10 conexões.
+_rawg_session = requests.Session()
+_rawg_session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=10))
+# Timeout (conexão, leitura) das chamadas externas: nenhuma prende o worker indefinidamente.
+_external_timeout = (3, 10)
+
 # --- Cache global para planilhas e dados ---
 _sheet_cache = {}
 _data_cache = {}
 _cache_ttl_seconds = 300 # Tempo de vida do cache em segundos (5 minutos)
 _last_cache_update = {}
+# Índice nome -> número da linha, derivado dos dados em cache de cada planilha
+_row_index_cache = {}
+# Jogos similares já montados (e com imagens) por nome do jogo base, em minúsculas
+_similar_games_cache = {}
+# Pares (Tipo, Mensagem) das notificações já gravadas, derivados do cache de dados
+_notification_keys_cache = {}
+# Detalhes de jogos da RAWG por RAWG_ID: (resposta, instante da busca)
+_rawg_details_cache = {}
+_rawg_details_cache_ttl_seconds = 3600
+_rawg_details_cache_max_size = 256
+# Traduções do DeepL já feitas (chave: sha256 do texto original) e cliente reaproveitado
+_translation_cache = {}
+_translation_cache_max_size = 512
+_deepl_client = {'translator': None}
+# Cabeçalho (linha 1) de cada aba, guardado a cada leitura da planilha
+_header_cache = {}
+# Colunas numéricas da aba 'Jogos' já convertidas, atreladas à lista de registros em cache
+_numeric_columns_cache = {}
+# Payloads já processados de get_all_game_data e get_public_profile_data. 'lock' faz o
+# single-flight da montagem; 'refreshing' garante uma só atualização em segundo plano.
+_game_data_cache = {'payload': None, 'updated_at': datetime.min, 'generation': 0,
+                    'lock': threading.Lock(), 'refreshing': threading.Lock()}
+_public_profile_cache = {'payload': None, 'updated_at': datetime.min, 'generation': 0,
+                         'lock': threading.Lock(), 'refreshing': threading.Lock()}
+_payload_caches = (_game_data_cache, _public_profile_cache)
+_payload_refresh_executor = ThreadPoolExecutor(max_workers=len(_payload_caches))
+# Idade máxima de um payload servido vencido; passou disso, a montagem é feita na hora.
+_payload_max_stale_seconds = 2 * _cache_ttl_seconds
+# Respostas quando a montagem falha e não há payload anterior para servir.
+_EMPTY_GAME_DATA = {'estatisticas': {}, 'biblioteca': [], 'desejos': [], 'perfil': {}, 'conquistas_concluidas': [], 'conquistas_pendentes': []}
+_EMPTY_PUBLIC_PROFILE = {'perfil': {}, 'estatisticas': {}, 'ultimos_platinados': []}
+# Abas que compõem o payload do dashboard; escritas nas demais não o invalidam
+_dashboard_sheets = frozenset({'Jogos', 'Desejos', 'Perfil', 'Conquistas', 'Historico de Preços'})
+
+# --- Cache do cliente autenticado do Google Sheets ---
+# O cliente e a planilha aberta são reaproveitados entre requisições e recriados
+# antes de completar 1h (validade do token do Google).
+_client_cache = {'client': None, 'spreadsheet': None, 'expires_at': 0}
+_client_ttl_seconds = 55 * 60
+_client_lock = threading.Lock()
+
+_sheets_scope = ['https://spreadsheets.google.com/feeds', 'https://www.googleapis.com/auth/drive']
+
+def _load_credentials():
+    """
+    Lê o JSON e a chave RSA da conta de serviço uma única vez, na importação do módulo.
+    As reautenticações periódicas do cliente reaproveitam o mesmo objeto.
+    """
+    if not Config.GOOGLE_SHEETS_CREDENTIALS_JSON:
+        print("CRITICAL ERROR: GOOGLE_SHEETS_CREDENTIALS_JSON não está definida em Config.")
+        return None
+    try:
+        creds_json = json.loads(Config.GOOGLE_SHEETS_CREDENTIALS_JSON)
+        creds = ServiceAccountCredentials.from_json_keyfile_dict(creds_json, _sheets_scope)
+        print("DEBUG: GOOGLE_SHEETS_CREDENTIALS_JSON lida com sucesso (conteúdo não exibido por segurança).")
+        return creds
+    except Exception as e:
+        logger.exception(f"ERRO: Falha ao ler GOOGLE_SHEETS_CREDENTIALS_JSON: {e}")
+        return None
+
+_credentials = _load_credentials()
+
+# Leituras que voltam 429/5xx são repetidas ali mesmo, com backoff exponencial, em vez
+# de falhar a requisição inteira. Só GET: escritas (append, batchUpdate) não são idempotentes.
+_sheets_retry = Retry(
+    total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({'GET'}), raise_on_status=False,
+)
+
+def _mount_sheets_retry(client):
+    """Monta o adaptador com retry na sessão HTTP do cliente gspread."""
+    http_client = getattr(client, 'http_client', None)
+    session = getattr(http_client, 'session', None) or getattr(client, 'session', None)
+    if session is not None:
+        session.mount('https://', HTTPAdapter(max_retries=_sheets_retry))
+
+def _get_spreadsheet():
+    """Retorna a planilha autenticada, reaproveitando o cliente enquanto estiver válido."""
+    if _client_cache['spreadsheet'] is not None and time.monotonic() < _client_cache['expires_at']:
+        return _client_cache['spreadsheet']
+
+    with _client_lock:
+        # Outra thread pode ter autenticado enquanto esperávamos o lock.
+        if _client_cache['spreadsheet'] is not None and time.monotonic() < _client_cache['expires_at']:
+            return _client_cache['spreadsheet']
+
+        print("DEBUG: Autenticando no Google Sheets e abrindo a planilha.")
+        print(f"DEBUG: Config.GAME_SHEET_URL: {Config.GAME_SHEET_URL}")
+        if _credentials is None:
+            print("CRITICAL ERROR: Credenciais do Google Sheets indisponíveis (ver GOOGLE_SHEETS_CREDENTIALS_JSON em Config).")
+            return None
+
+        client = gspread.authorize(_credentials)
+        _mount_sheets_retry(client)
+        spreadsheet = client.open_by_url(Config.GAME_SHEET_URL)
+
+        # Handles de abas pertencem ao cliente antigo; descarta-os junto com ele.
+        _sheet_cache.clear()
+        _client_cache['client'] = client
+        _client_cache['spreadsheet'] = spreadsheet
+        _client_cache['expires_at'] = time.monotonic() + _client_ttl_seconds
+        return spreadsheet
+
+def _reset_spreadsheet():
+    """Descarta o cliente autenticado (ex.: token revogado); o próximo acesso reautentica."""
+    with _client_lock:
+        _client_cache['spreadsheet'] = None
+        _client_cache['client'] = None
+        _client_cache['expires_at'] = 0
+        _sheet_cache.clear()
+
+def _is_auth_error(error):
+    """Indica se o erro da API do Google é um 401 (credencial expirada ou inválida)."""
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None) == 401
 
 def _get_sheet(sheet_name):
     """Retorna o objeto da planilha, usando cache."""
-    if sheet_name in _sheet_cache:
-        print(f"DEBUG: Planilha '{sheet_name}' encontrada no cache de sheets.")
-        return _sheet_cache[sheet_name]
     try:
-        print(f"DEBUG: Tentando autenticar e abrir planilha '{sheet_name}'.")
-        
-        print(f"DEBUG: Config.GAME_SHEET_URL: {Config.GAME_SHEET_URL}")
-        if not Config.GOOGLE_SHEETS_CREDENTIALS_JSON:
-            print("CRITICAL ERROR: GOOGLE_SHEETS_CREDENTIALS_JSON não está definida em Config.")
+        spreadsheet = _get_spreadsheet()
+        if not spreadsheet:
             return None
-        
-        creds_json = json.loads(Config.GOOGLE_SHEETS_CREDENTIALS_JSON)
-        print("DEBUG: GOOGLE_SHEETS_CREDENTIALS_JSON lida com sucesso (conteúdo não exibido por segurança).")
 
-        scope = ['https://spreadsheets.google.com/feeds', 'https://www.googleapis.com/auth/drive']
-        creds = ServiceAccountCredentials.from_json_keyfile_dict(creds_json, scope)
-        client = gspread.authorize(creds)
-        
-        spreadsheet = client.open_by_url(Config.GAME_SHEET_URL)
+        if sheet_name in _sheet_cache:
+            print(f"DEBUG: Planilha '{sheet_name}' encontrada no cache de sheets.")
+            return _sheet_cache[sheet_name]
+
+        print(f"DEBUG: Tentando abrir planilha '{sheet_name}'.")
         worksheet = spreadsheet.worksheet(sheet_name)
         _sheet_cache[sheet_name] = worksheet
         print(f"DEBUG: Planilha '{sheet_name}' aberta com sucesso.")
         return worksheet
     except Exception as e:
-        print(f"ERRO CRÍTICO: Falha ao autenticar ou abrir planilha '{sheet_name}': {e}"); traceback.print_exc()
+        logger.exception(f"ERRO CRÍTICO: Falha ao autenticar ou abrir planilha '{sheet_name}': {e}")
         return None
 
+def _is_data_cache_fresh(sheet_name, current_time):
+    """Indica se os dados em cache da planilha ainda estão dentro do TTL."""
+    return sheet_name in _data_cache and \
+        (current_time - _last_cache_update.get(sheet_name, datetime.min)).total_seconds() < _cache_ttl_seconds
+
+def _records_from_values(values):
+    """
+    Converte a matriz de valores de uma aba (cabeçalho + linhas) em uma lista de
+    dicionários, replicando localmente o comportamento do get_all_records.
+    """
+    if not values:
+        return []
+    headers = values[0]
+    num_cols = len(headers)
+    return [
+        dict(zip(headers, numericise_all(row + [''] * (num_cols - len(row)))))
+        for row in values[1:]
+    ]
+
+def _get_data_from_sheets(sheet_names):
+    """
+    Retorna {nome_da_aba: registros} para várias abas. As que não estão em cache são
+    lidas juntas em uma única chamada values_batch_get (um só round-trip ao Google).
+    Aba cuja leitura falhou vem como None (e não []), para quem chama distinguir
+    falha de aba vazia.
+    """
+    current_time = datetime.now()
+    result = {}
+    missing = []
+    for sheet_name in sheet_names:
+        if _is_data_cache_fresh(sheet_name, current_time):
+            print(f"DEBUG: Dados da planilha '{sheet_name}' servidos do cache de dados.")
+            result[sheet_name] = _data_cache[sheet_name]
+        else:
+            missing.append(sheet_name)
+
+    if not missing:
+        return result
+
+    try:
+        spreadsheet = _get_spreadsheet()
+        if not spreadsheet:
+            raise RuntimeError("Planilha indisponível.")
+        print(f"DEBUG: Lendo em lote as planilhas {missing}.")
+        response = spreadsheet.values_batch_get([f"'{sheet_name}'" for sheet_name in missing])
+        for sheet_name, value_range in zip(missing, response.get('valueRanges', [])):
+            values = value_range.get('values', [])
+            if values:
+                _header_cache[sheet_name] = values[0]
+            data = _records_from_values(values)
+            _data_cache[sheet_name] = data
+            _last_cache_update[sheet_name] = current_time
+            result[sheet_name] = data
+            print(f"DEBUG: Dados da planilha '{sheet_name}' atualizados do Google Sheets e armazenados em cache. Total de registros: {len(data)}")
+    except Exception as e:
+        if _is_auth_error(e):
+            # Token recusado: descarta o cliente para que as leituras individuais reautentiquem.
+            _reset_spreadsheet()
+        logger.exception(f"ERRO: Falha na leitura em lote das planilhas {missing}, lendo individualmente: {e}")
+
+    # Qualquer aba que não veio no lote é lida pelo caminho individual.
+    for sheet_name in missing:
+        if sheet_name not in result:
+            result[sheet_name] = _read_sheet_data(sheet_name)
+    return result
+
 def _get_data_from_sheet(sheet_name):
-    """Retorna os dados da planilha, usando cache com TTL."""
+    """Retorna os dados da planilha, usando cache com TTL (lista vazia se a leitura falhar)."""
+    data = _read_sheet_data(sheet_name)
+    return data if data is not None else []
+
+def _read_sheet_data(sheet_name, _retry_on_auth_error=True):
+    """
+    Lê os registros da aba, usando cache com TTL. Retorna None se a leitura falhar;
+    uma aba realmente vazia retorna [].
+    """
     current_time = datetime.now()
-    if sheet_name in _data_cache and \
-       (current_time - _last_cache_update.get(sheet_name, datetime.min)).total_seconds() < _cache_ttl_seconds:
+    if _is_data_cache_fresh(sheet_name, current_time):
         print(f"DEBUG: Dados da planilha '{sheet_name}' servidos do cache de dados.")
         return _data_cache[sheet_name]
 
     sheet = _get_sheet(sheet_name)
     if not sheet:
-        print(f"DEBUG: Não foi possível obter o objeto da planilha para '{sheet_name}', retornando lista vazia.")
-        return []
+        print(f"DEBUG: Não foi possível obter o objeto da planilha para '{sheet_name}'.")
+        return None
 
     try:
         print(f"DEBUG: Tentando ler todos os registros da planilha '{sheet_name}'.")
-        data = sheet.get_all_records()
+        # Uma única chamada values_get (matriz crua) e os dicionários montados localmente,
+        # em vez do get_all_records. Os valores continuam FORMATTED_VALUE, como antes.
+        response = sheet.spreadsheet.values_get(f"'{sheet.title}'")
+        values = response.get('values', [])
+        if values:
+            _header_cache[sheet_name] = values[0]
+        data = _records_from_values(values)
         
         print(f"DEBUG: Dados brutos de '{sheet_name}' (primeiros 5 registros): {data[:5]}")
         if data:
@@ -127,46 +334,247 @@ def _get_data_from_sheet(sheet_name):
         if "unable to parse range" in str(e): 
             print(f"AVISO: Planilha '{sheet_name}' vazia ou com erro de range, retornando lista vazia. Detalhes: {e}")
             return []
-        print(f"ERRO: Erro ao ler dados da planilha '{sheet_name}': {e}"); traceback.print_exc()
-        return []
+        if _retry_on_auth_error and _is_auth_error(e):
+            print(f"AVISO: Credencial recusada (401) ao ler '{sheet_name}'; reautenticando e tentando de novo.")
+            _reset_spreadsheet()
+            return _read_sheet_data(sheet_name, _retry_on_auth_error=False)
+        logger.exception(f"ERRO: Erro ao ler dados da planilha '{sheet_name}': {e}")
+        return None
     except Exception as e:
-        print(f"ERRO GENÉRICO: Erro ao ler dados da planilha '{sheet_name}': {e}"); traceback.print_exc()
-        return []
+        logger.exception(f"ERRO GENÉRICO: Erro ao ler dados da planilha '{sheet_name}': {e}")
+        return None
+
+def _get_headers(sheet_name, sheet):
+    """
+    Retorna o cabeçalho da aba. Usa o que veio na última leitura dos dados e só
+    faz o round-trip do row_values(1) se a aba ainda não foi lida.
+    """
+    headers = _header_cache.get(sheet_name)
+    if headers is None:
+        headers = sheet.row_values(1)
+        _header_cache[sheet_name] = headers
+    return headers
+
+def _get_row_index(sheet_name):
+    """Índice nome -> linha (contando o cabeçalho) montado a partir dos dados em cache."""
+    records = _get_data_from_sheet(sheet_name)
+    cached_index = _row_index_cache.get(sheet_name)
+    if cached_index is None or cached_index[0] is not records:
+        name_to_row = {}
+        for i, record in enumerate(records):
+            name_to_row.setdefault(str(record.get('Nome', '')), i + 2)
+        cached_index = (records, name_to_row)
+        _row_index_cache[sheet_name] = cached_index
+    return cached_index[1]
+
+def _get_name_column(sheet_name, sheet):
+    """Número (1-based) da coluna 'Nome' da aba."""
+    headers = [h.strip() for h in _get_headers(sheet_name, sheet)]
+    return headers.index('Nome') + 1 if 'Nome' in headers else 1
+
+def _find_cell_row(sheet, item_name, name_column):
+    """Procura o item direto na planilha, só na coluna 'Nome'."""
+    try:
+        cell = sheet.find(str(item_name), in_column=name_column)
+    except gspread.exceptions.CellNotFound:
+        return None
+    return cell.row if cell else None
+
+def _find_row_numbers(sheet_name, item_names, sheet):
+    """
+    Retorna {nome: linha} para os itens encontrados na coluna 'Nome'.
+    O índice em cache pode estar desatualizado (TTL de 5 minutos, edições direto na
+    planilha), então ele é só uma dica: a célula 'Nome' de cada linha sugerida é lida
+    da planilha em uma única chamada values_batch_get antes de qualquer escrita. Se
+    não bater, o item é procurado com sheet.find e o índice é descartado.
+    """
+    name_column = _get_name_column(sheet_name, sheet)
+    row_index = _get_row_index(sheet_name)
+    hints = {name: row_index[str(name)] for name in item_names if str(name) in row_index}
+
+    live_names = {}
+    if hints:
+        hinted_rows = sorted(set(hints.values()))
+        ranges = [f"'{sheet.title}'!{gspread.utils.rowcol_to_a1(row, name_column)}" for row in hinted_rows]
+        response = sheet.spreadsheet.values_batch_get(ranges)
+        for row, value_range in zip(hinted_rows, response.get('valueRanges', [])):
+            values = value_range.get('values', [])
+            live_names[row] = str(values[0][0]) if values and values[0] else ''
+
+    rows = {}
+    index_is_stale = False
+    for name in item_names:
+        row_number = hints.get(name)
+        if row_number and live_names.get(row_number) == str(name):
+            rows[name] = row_number
+            continue
+        if row_number:
+            index_is_stale = True
+        row_number = _find_cell_row(sheet, name, name_column)
+        if row_number:
+            rows[name] = row_number
+
+    if index_is_stale:
+        print(f"AVISO: Índice de linhas de '{sheet_name}' desatualizado em relação à planilha; descartando o cache.")
+        _invalidate_cache(sheet_name)
+    return rows
+
+def _find_row_number(sheet_name, item_name, sheet):
+    """Retorna o número da linha (contando o cabeçalho) do item pela coluna 'Nome', conferido na planilha."""
+    return _find_row_numbers(sheet_name, [item_name], sheet).get(item_name)
 
 def _invalidate_cache(sheet_name):
     """Invalida o cache para uma planilha específica."""
     if sheet_name in _data_cache:
         del _data_cache[sheet_name]
+    _row_index_cache.pop(sheet_name, None)
+    # Só escritas em abas usadas pelo dashboard invalidam o payload montado
+    # (ex.: marcar uma notificação como lida não muda o dashboard).
+    if sheet_name in _dashboard_sheets:
+        for payload_cache in _payload_caches:
+            payload_cache['payload'] = None
+            payload_cache['generation'] += 1
     print(f"DEBUG: Cache para a planilha '{sheet_name}' invalidado.")
 
+# Tabelas de tradução: uma única passada em C no lugar de vários .replace encadeados
+_PRICE_TRANSLATION = str.maketrans({'R': None, '$': None, ',': '.'})
+_HOURS_TRANSLATION = str.maketrans({'h': None})
+
+# Os mesmos textos ('R$ 59,90', '40h', '') se repetem muito na planilha, então o
+# resultado da conversão fica memorizado; None indica valor inválido.
+@lru_cache(maxsize=2048)
+def _parse_float(text):
+    try: return float(text.translate(_PRICE_TRANSLATION).strip())
+    except ValueError: return None
+
+@lru_cache(maxsize=2048)
+def _parse_int(text):
+    try: return int(text.translate(_HOURS_TRANSLATION).strip())
+    except ValueError: return None
+
+def _safe_float(value, default=0.0):
+    """Converte valores como 'R$ 29,90' ou '8,5' para float sem levantar exceção."""
+    # Células numéricas já chegam como int/float (numericise): nada a parsear.
+    if type(value) in (int, float):
+        return float(value)
+    parsed = _parse_float(str(value))
+    return default if parsed is None else parsed
+
+def _safe_int(value, default=0):
+    """Converte valores como '40h' ou '12' para int sem levantar exceção (ex.: células vazias)."""
+    if type(value) is int:
+        return value
+    parsed = _parse_int(str(value))
+    return default if parsed is None else parsed
+
+def _get_numeric_columns(games_data):
+    """
+    Retorna as colunas numéricas dos jogos (Preço, Nota, Tempo de Jogo e Conquistas
+    Obtidas) já convertidas. A conversão é feita uma vez por leitura da planilha e
+    reaproveitada enquanto a mesma lista estiver em cache. Nota vazia vira None.
+    """
+    cached = _numeric_columns_cache.get('Jogos')
+    if cached is None or cached[0] is not games_data:
+        columns = {
+            'preco': [_safe_float(game.get('Preço')) for game in games_data],
+            'nota': [_safe_float(game.get('Nota')) if game.get('Nota') else None for game in games_data],
+            'horas': [_safe_int(game.get('Tempo de Jogo', 0)) for game in games_data],
+            'conquistas': [_safe_int(game.get('Conquistas Obtidas', 0)) for game in games_data],
+        }
+        cached = (games_data, columns)
+        _numeric_columns_cache['Jogos'] = cached
+    return cached[1]
+
+def _compute_base_stats(games_data):
+    """
+    Calcula em uma única passada pelos jogos as estatísticas da biblioteca e os
+    contadores usados no progresso das conquistas e na EXP. Retorna os dois
+    separados: só as estatísticas fazem parte do 'estatisticas' da API.
+    """
+    total_finalizados = total_platinados = 0
+    finalizados_acao = finalizados_estrategia = 0
+    soulslike_platinados = indie_total = jogos_longos = 0
+    notas_10 = notas_baixas = 0
+    exp_jogos = 0
+    generos = set()
+    numeric = _get_numeric_columns(games_data)
+
+    for game, nota, horas in zip(games_data, numeric['nota'], numeric['horas']):
+        estilo = str(game.get('Estilo', '') or '')
+        # Gêneros da célula separados uma vez; os testes abaixo viram busca em set.
+        # Vírgulas sobrando ('RPG,', 'Ação, ') não viram um gênero vazio.
+        estilo_set = {genero.strip() for genero in estilo.split(',') if genero.strip()}
+        status = game.get('Status')
+        finalizado = status in ('Finalizado', 'Platinado')
+        platinado = game.get('Platinado?') == 'Sim'
+        if status == 'Finalizado': exp_jogos += 100
+        elif status == 'Platinado': exp_jogos += 500
+        if finalizado:
+            total_finalizados += 1
+            if 'Ação' in estilo_set: finalizados_acao += 1
+            if 'Estratégia' in estilo_set: finalizados_estrategia += 1
+        if platinado:
+            total_platinados += 1
+            if 'Soulslike' in estilo_set: soulslike_platinados += 1
+        if 'Indie' in estilo_set: indie_total += 1
+        generos.update(estilo_set)
+        if horas >= 50: jogos_longos += 1
+        if nota is not None:
+            if nota > 0: exp_jogos += int(nota)
+            if nota == 100: notas_10 += 1
+            if nota <= 30: notas_baixas += 1
+
+    notas = [nota for nota in numeric['nota'] if nota is not None]
+    total_avaliados = sum(1 for nota in notas if nota > 0)
+    soma_notas = sum(notas)
+    qtd_notas = len(notas)
+    total_horas_jogadas = sum(numeric['horas'])
+    custo_total_biblioteca = sum(numeric['preco'])
+    total_conquistas = sum(numeric['conquistas'])
+    exp_jogos += total_conquistas
+
+    stats = {
+        'total_jogos': len(games_data), 'total_finalizados': total_finalizados,
+        'total_platinados': total_platinados, 'total_avaliados': total_avaliados,
+        'total_horas_jogadas': total_horas_jogadas, 'custo_total_biblioteca': custo_total_biblioteca,
+        'media_notas': soma_notas / qtd_notas if qtd_notas else 0, 'total_conquistas': total_conquistas,
+    }
+    counters = {
+        'max_horas_um_jogo': max(numeric['horas'], default=0), 'total_jogos_longos': jogos_longos,
+        'total_soulslike_platinados': soulslike_platinados, 'total_indie': indie_total,
+        'total_finalizados_acao': finalizados_acao, 'total_finalizados_estrategia': finalizados_estrategia,
+        'total_generos_diferentes': len(generos), 'total_notas_10': notas_10, 'total_notas_baixas': notas_baixas,
+        'exp_jogos': exp_jogos,
+    }
+    return stats, counters
+
+# Tipo de conquista -> chave (das estatísticas ou dos contadores de _compute_base_stats)
+# com o progresso correspondente.
+# WISHLIST_TOTAL é tratado à parte (vem do tamanho da lista de desejos).
+_ACHIEVEMENT_STAT_KEYS = MappingProxyType({
+    'FINALIZADOS': 'total_finalizados', 'PLATINADOS': 'total_platinados',
+    'TOTAL_JOGOS': 'total_jogos', 'HORAS_JOGADAS': 'total_horas_jogadas',
+    'CUSTO_TOTAL': 'custo_total_biblioteca', 'JOGOS_AVALIADOS': 'total_avaliados',
+    'JOGOS_LONGOS': 'total_jogos_longos', 'SOULSLIKE_PLATINADOS': 'total_soulslike_platinados',
+    'INDIE_TOTAL': 'total_indie', 'JOGO_MAIS_JOGADO': 'max_horas_um_jogo',
+    'FINALIZADOS_ACAO': 'total_finalizados_acao', 'FINALIZADOS_ESTRATEGIA': 'total_finalizados_estrategia',
+    'GENEROS_DIFERENTES': 'total_generos_diferentes', 'NOTAS_10': 'total_notas_10',
+    'NOTAS_BAIXAS': 'total_notas_baixas',
+})
+
 def _check_achievements(games_data, stats, all_achievements, wishlist_data):
     completed = []
     pending = []
     
-    progress_map = {
-        'FINALIZADOS': stats.get('total_finalizados', 0),
-        'PLATINADOS': stats.get('total_platinados', 0),
-        'TOTAL_JOGOS': stats.get('total_jogos', 0),
-        'HORAS_JOGADAS': stats.get('total_horas_jogadas', 0),
-        'CUSTO_TOTAL': stats.get('custo_total_biblioteca', 0),
-        'JOGOS_AVALIADOS': stats.get('total_avaliados', 0),
-        'WISHLIST_TOTAL': len(wishlist_data),
-        'JOGOS_LONGOS': len([g for g in games_data if g.get('Tempo de Jogo') and int(str(g['Tempo de Jogo']).replace('h', '')) >= 50]),
-        'SOULSLIKE_PLATINADOS': len([g for g in games_data if g.get('Platinado?') == 'Sim' and 'Soulslike' in g.get('Estilo', '')]),
-        'INDIE_TOTAL': len([g for g in games_data if 'Indie' in g.get('Estilo', '')]),
-        'JOGO_MAIS_JOGADO': stats.get('max_horas_um_jogo', 0),
-        'FINALIZADOS_ACAO': len([g for g in games_data if g.get('Status') in ['Finalizado', 'Platinado'] and 'Ação' in g.get('Estilo', '')]),
-        'FINALIZADOS_ESTRATEGIA': len([g for g in games_data if g.get('Status') in ['Finalizado', 'Platinado'] and 'Estratégia' in g.get('Estilo', '')]),
-        'GENEROS_DIFERENTES': len(set(g for game in games_data if game.get('Estilo') for g in game.get('Estilo').split(','))),
-        'NOTAS_10': len([n for n in [float(str(g.get('Nota', 0)).replace(',', '.')) for g in games_data if g.get('Nota')] if n == 100]),
-        'NOTAS_BAIXAS': len([n for n in [float(str(g.get('Nota', 0)).replace(',', '.') ) for g in games_data if g.get('Nota')] if n <= 30]),
-    }
+    wishlist_total = len(wishlist_data)
     
     for ach in all_achievements:
         ach_type = ach.get('Tipo')
-        try: target = float(ach.get('Meta', 0))
-        except (ValueError, TypeError): target = 0
-        current_progress = progress_map.get(ach_type, 0)
+        target = _safe_float(ach.get('Meta', 0), default=0)
+        stat_key = _ACHIEVEMENT_STAT_KEYS.get(ach_type)
+        if ach_type == 'WISHLIST_TOTAL': current_progress = wishlist_total
+        elif stat_key: current_progress = stats.get(stat_key, 0)
+        else: current_progress = 0
         
         ach['progresso_atual'] = current_progress
         ach['meta'] = target
@@ -178,27 +586,19 @@ def _check_achievements(games_data, stats, all_achievements, wishlist_data):
             
     return completed, pending
 
-def _calculate_gamer_stats(games_data, unlocked_achievements):
-    total_exp = 0
-    for game in games_data:
-        if game.get('Status') == 'Finalizado': total_exp += 100
-        elif game.get('Status') == 'Platinado': total_exp += 500
-        try:
-            nota = float(str(game.get('Nota', '0')).replace(',', '.'))
-            if nota > 0: total_exp += int(nota)
-        except ValueError: pass
-        total_exp += int(game.get('Conquistas Obtidas', 0))
+# Nível mínimo de cada rank, em ordem crescente (consultado com bisect)
+_RANK_LEVELS = (0, 10, 20, 30, 40, 50)
+_RANK_NAMES = ("Bronze", "Prata", "Ouro", "Platina", "Diamante", "Mestre")
 
+def _calculate_gamer_stats(counters, unlocked_achievements):
+    # A EXP vinda dos jogos já é somada na passada de _compute_base_stats.
+    total_exp = counters.get('exp_jogos', 0)
     for ach in unlocked_achievements:
         total_exp += int(ach.get('EXP', 0))
 
     exp_per_level = 1000
-    nivel = math.floor(total_exp / exp_per_level)
-    exp_no_nivel_atual = total_exp % exp_per_level
-    ranks = {0: "Bronze", 10: "Prata", 20: "Ouro", 30: "Platina", 40: "Diamante", 50: "Mestre"}
-    rank_gamer = "Bronze"
-    for level_req, rank_name in ranks.items():
-        if nivel >= level_req: rank_gamer = rank_name
+    nivel, exp_no_nivel_atual = divmod(total_exp, exp_per_level)
+    rank_gamer = _RANK_NAMES[max(bisect_right(_RANK_LEVELS, nivel) - 1, 0)]
     return {'nivel_gamer': nivel, 'rank_gamer': rank_gamer, 'exp_nivel_atual': exp_no_nivel_atual, 'exp_para_proximo_nivel': exp_per_level}
 
 # --- Funções para gerenciar notificações ---
@@ -206,6 +606,19 @@ def _get_notifications_sheet():
     """Retorna o objeto da aba de notificações."""
     return _get_sheet('Notificações')
 
+def _get_notification_keys(notifications):
+    """
+    Retorna o conjunto de pares (Tipo, Mensagem) já existentes, montado uma vez por
+    leitura da planilha. get_all_game_data checa dezenas de notificações por
+    requisição, e cada checagem vira uma busca O(1) em vez de varrer a lista toda.
+    """
+    cached = _notification_keys_cache.get('keys')
+    if cached is None or cached[0] is not notifications:
+        keys = {(notif.get('Tipo'), notif.get('Mensagem')) for notif in notifications}
+        cached = (notifications, keys)
+        _notification_keys_cache['keys'] = cached
+    return cached[1]
+
 def _add_notification(notification_type, message, link_target=None):
     """Adiciona uma nova notificação à planilha, incluindo um link de destino."""
     sheet = _get_notifications_sheet()
@@ -217,10 +630,9 @@ def _add_notification(notification_type, message, link_target=None):
     brasilia_tz = pytz.timezone('America/Sao_Paulo')
     current_time = datetime.now(brasilia_tz)
 
-    for notif in notifications:
-        if notif.get('Tipo') == notification_type and notif.get('Mensagem') == message:
-            print(f"DEBUG: Notificação duplicada evitada: Tipo='{notification_type}', Mensagem='{message}'")
-            return {"success": False, "message": "Notificação duplicada evitada."}
+    if (notification_type, message) in _get_notification_keys(notifications):
+        print(f"DEBUG: Notificação duplicada evitada: Tipo='{notification_type}', Mensagem='{message}'")
+        return {"success": False, "message": "Notificação duplicada evitada."}
 
     new_id = len(notifications) + 1
     timestamp = current_time.strftime("%Y-%m-%d %H:%M:%S")
@@ -290,7 +702,7 @@ def mark_notification_as_read(notification_id):
         print("ERRO: Colunas 'ID' ou 'Lida' não encontradas na planilha de Notificações.")
         return {"success": False, "message": "Erro: Colunas necessárias não encontradas."}
     except Exception as e:
-        print(f"ERRO ao marcar notificação {notification_id} como lida: {e}"); traceback.print_exc()
+        logger.exception(f"ERRO ao marcar notificação {notification_id} como lida: {e}")
         return {"success": False, "message": "Erro ao atualizar notificação."}
 
 # --- FIM DAS Funções de Notificação ---
@@ -304,111 +716,172 @@ def get_price_history_for_game(game_name: str):
         if not history_data:
             return []
 
-        game_history = [
-            {'date': item.get('Data'), 'platform': item.get('Plataforma'), 'price': float(str(item.get('Preço', 0)).replace(',', '.'))}
-            for item in history_data if item.get('Nome do Jogo') == game_name and item.get('Preço') not in ['Não encontrado', 'Gratuito', None, '']
-        ]
+        game_history = []
+        for item in history_data:
+            if item.get('Nome do Jogo') != game_name or item.get('Preço') in ['Não encontrado', 'Gratuito', None, '']:
+                continue
+            price = _safe_float(item.get('Preço'), default=None)
+            if price is not None:
+                game_history.append({'date': item.get('Data'), 'platform': item.get('Plataforma'), 'price': price})
         
         game_history.sort(key=lambda x: datetime.strptime(x['date'], "%Y-%m-%d"))
         
         return game_history
     except Exception as e:
-        print(f"ERRO: Erro ao obter histórico de preços para '{game_name}': {e}"); traceback.print_exc()
+        logger.exception(f"ERRO: Erro ao obter histórico de preços para '{game_name}': {e}")
         return []
 
-def _check_for_promotions(wish, existing_notifications, all_history_data):
-    game_name = wish.get('Nome', 'Um jogo')
+def _group_recent_prices(all_history_data):
+    """
+    Agrupa o histórico de preços dos últimos 30 dias em {jogo: {plataforma: [preços]}},
+    numa única passada. Assim cada desejo consulta só os próprios preços em vez de
+    varrer o histórico inteiro.
+    """
     brasilia_tz = pytz.timezone('America/Sao_Paulo')
-    today_date = datetime.now(brasilia_tz).date()
-    today_timestamp = pd.Timestamp(today_date)
-    promotion_found = False
+    cutoff_date = datetime.now(brasilia_tz).date() - timedelta(days=30)
+    prices_by_game = {}
+    for item in all_history_data:
+        platform_name = item.get('Plataforma')
+        if platform_name not in ('Steam', 'PSN') or item.get('Preço') in ['Não encontrado', 'Gratuito', None, '']:
+            continue
+        try:
+            item_date = datetime.strptime(str(item.get('Data'))[:10], "%Y-%m-%d").date()
+            if item_date >= cutoff_date:
+                price = _safe_float(item.get('Preço'), default=None)
+                if price is not None:
+                    game_prices = prices_by_game.setdefault(item.get('Nome do Jogo'), {'Steam': [], 'PSN': []})
+                    game_prices[platform_name].append(price)
+        except ValueError:
+            continue
+    return prices_by_game
 
-    game_history_raw = [
-        item for item in all_history_data
-        if item.get('Nome do Jogo') == game_name and item.get('Preço') not in ['Não encontrado', 'Gratuito', None, '']
-    ]
-    
-    if not game_history_raw:
-        return False
+def _check_for_promotions(wish, existing_notifications, recent_prices_by_game):
+    game_name = wish.get('Nome', 'Um jogo')
+    promotion_found = False
 
-    df_history = pd.DataFrame(game_history_raw)
-    df_history['Data'] = pd.to_datetime(df_history['Data'])
-    df_history['Preço'] = df_history['Preço'].astype(str).str.replace(',', '.').astype(float)
-    df_history = df_history.sort_values(by='Data')
+    # Preços dos últimos 30 dias do jogo, separados por plataforma
+    recent_prices = recent_prices_by_game.get(game_name)
+    if not recent_prices:
+        return promotion_found
 
-    steam_history = df_history[df_history['Plataforma'] == 'Steam']
-    psn_history = df_history[df_history['Plataforma'] == 'PSN']
+    for platform_name, current_price_str in (('Steam', wish.get('Steam Preco Atual')), ('PSN', wish.get('PSN Preco Atual'))):
+        last_30_days_prices = recent_prices[platform_name]
+        if not last_30_days_prices:
+            continue
 
-    def check_platform_promotion(platform_name, history_df, current_price_str):
-        nonlocal promotion_found
-        if history_df.empty:
-            return
+        current_price_float = _safe_float(current_price_str, default=None) if current_price_str not in ['Não encontrado', 'Gratuito', None, ''] else None
+        if not current_price_float:
+            continue
 
-        current_price_float = float(str(current_price_str).replace(',', '.')) if current_price_str not in ['Não encontrado', 'Gratuito', None, ''] else float('inf')
-        if current_price_float == float('inf') or current_price_float == 0.0:
-            return
-        
-        last_30_days_data = history_df[history_df['Data'] >= (today_timestamp - timedelta(days=30))]
-        if not last_30_days_data.empty:
-            average_price_30_days = last_30_days_data['Preço'].mean()
-            if current_price_float <= average_price_30_days * 0.80:
-                notification_message = f"Promoção na {platform_name}! '{game_name}' por R${current_price_float:.2f}."
-                _add_notification("Promoção", notification_message, link_target=game_name)
-                promotion_found = True
-                return
-
-    check_platform_promotion('Steam', steam_history, wish.get('Steam Preco Atual'))
-    check_platform_promotion('PSN', psn_history, wish.get('PSN Preco Atual'))
+        average_price_30_days = sum(last_30_days_prices) / len(last_30_days_prices)
+        if current_price_float <= average_price_30_days * 0.80:
+            notification_message = f"Promoção na {platform_name}! '{game_name}' por R${current_price_float:.2f}."
+            _add_notification("Promoção", notification_message, link_target=game_name)
+            promotion_found = True
 
     return promotion_found
 
+def _refresh_payload(payload_cache, build):
+    """
+    Remonta um payload em segundo plano (a função build grava o resultado no cache).
+    Se a montagem falhar, build retorna None sem gravar e o payload anterior continua.
+    """
+    try:
+        with payload_cache['lock']:
+            build()
+    finally:
+        payload_cache['refreshing'].release()
+
+def _serve_payload(payload_cache, build, label, empty_payload):
+    """
+    Serve um payload montado a partir do cache:
+    - dentro do TTL, devolve direto;
+    - vencido há pouco (até 2x o TTL, sem invalidação por escrita), devolve o anterior
+      e agenda uma única atualização em segundo plano (stale-while-revalidate);
+    - invalidado, inexistente ou velho demais, monta na hora com single-flight: as
+      demais threads esperam no lock e recebem o mesmo resultado em vez de repetir a leitura.
+    Se a montagem falhar (build retorna None), serve o payload anterior, se houver,
+    ou empty_payload.
+    """
+    payload = payload_cache['payload']
+    if payload is not None:
+        age = (datetime.now() - payload_cache['updated_at']).total_seconds()
+        if age < _payload_max_stale_seconds:
+            if age >= _cache_ttl_seconds and payload_cache['refreshing'].acquire(blocking=False):
+                print(f"DEBUG: {label} vencidos; servindo o cache e atualizando em segundo plano.")
+                try:
+                    _payload_refresh_executor.submit(_refresh_payload, payload_cache, build)
+                except Exception as e:
+                    payload_cache['refreshing'].release()
+                    logger.exception(f"ERRO: Falha ao agendar a atualização de {label}: {e}")
+            print(f"DEBUG: {label} servidos do cache.")
+            return payload
+
+    with payload_cache['lock']:
+        payload = payload_cache['payload']
+        if payload is not None and (datetime.now() - payload_cache['updated_at']).total_seconds() < _payload_max_stale_seconds:
+            return payload
+        print(f"DEBUG: {label} ausentes ou vencidos há mais de {_payload_max_stale_seconds}s; montando na hora.")
+        built = build()
+        if built is not None:
+            return built
+        if payload is not None:
+            print(f"AVISO: Falha ao montar {label}; servindo o payload anterior.")
+            return payload
+        return dict(empty_payload)
+
 def get_all_game_data():
+    return _serve_payload(_game_data_cache, _build_all_game_data, "Dados do dashboard", _EMPTY_GAME_DATA)
+
+def _build_all_game_data():
+    current_cache_time = datetime.now()
+    generation = _game_data_cache['generation']
     try:
         brasilia_tz = pytz.timezone('America/Sao_Paulo')
         current_time = datetime.now(brasilia_tz)
-        game_sheet_data = _get_data_from_sheet('Jogos'); games_data = game_sheet_data if game_sheet_data else []
-        wishlist_sheet_data = _get_data_from_sheet('Desejos'); all_wishlist_data = wishlist_sheet_data if wishlist_sheet_data else []
+        # Todas as abas do dashboard vêm de um único values_batch_get (um round-trip);
+        # se o lote falhar, _get_data_from_sheets lê cada aba individualmente.
+        sheets_data = _get_data_from_sheets(['Jogos', 'Desejos', 'Perfil', 'Conquistas', 'Historico de Preços', 'Notificações'])
+        games_data = sheets_data['Jogos']
+        all_wishlist_data = sheets_data['Desejos'] or []
+
+        # Leitura da aba 'Jogos' falhou: não há o que ordenar, agregar ou notificar, e o
+        # resultado não vai para o cache para que a próxima requisição tente de novo.
+        if games_data is None:
+            print("AVISO: Aba 'Jogos' indisponível; dashboard não será montado nem guardado em cache.")
+            return None
         
-        def safe_float_conversion(value):
-            try: return float(str(value).replace('R$', '').replace(',', '.').strip())
-            except (ValueError, TypeError): return 0.0 
-
         processed_wishlist_data = [
             {**wish, 
-             'Steam Preco Atual': safe_float_conversion(wish.get('Steam Preco Atual')),
-             'Steam Menor Preco Historico': safe_float_conversion(wish.get('Steam Menor Preco Historico')),
-             'PSN Preco Atual': safe_float_conversion(wish.get('PSN Preco Atual')),
-             'PSN Menor Preco Historico': safe_float_conversion(wish.get('PSN Menor Preco Historico')),
-             'Preço': safe_float_conversion(wish.get('Preço'))}
+             'Steam Preco Atual': _safe_float(wish.get('Steam Preco Atual')),
+             'Steam Menor Preco Historico': _safe_float(wish.get('Steam Menor Preco Historico')),
+             'PSN Preco Atual': _safe_float(wish.get('PSN Preco Atual')),
+             'PSN Menor Preco Historico': _safe_float(wish.get('PSN Menor Preco Historico')),
+             'Preço': _safe_float(wish.get('Preço'))}
             for wish in all_wishlist_data
         ]
 
         wishlist_data_filtered = [item for item in processed_wishlist_data if item.get('Status') != 'Comprado']
-        profile_sheet_data = _get_data_from_sheet('Perfil'); profile_records = profile_sheet_data if profile_sheet_data else []
+        profile_records = sheets_data['Perfil'] or []
         profile_data = {item['Chave']: item['Valor'] for item in profile_records}
-        achievements_sheet_data = _get_data_from_sheet('Conquistas'); all_achievements = achievements_sheet_data if achievements_sheet_data else []
+        all_achievements = sheets_data['Conquistas'] or []
         
+        # 'Notificações' já foi lida acima, então esta chamada é servida do cache.
         existing_notifications = get_all_notifications_for_frontend()
-        all_price_history_data = _get_data_from_sheet('Historico de Preços')
-
-        def sort_key(game):
-            try: nota = float(str(game.get('Nota', '-1')).replace(',', '.'))
-            except (ValueError, TypeError): nota = -1
-            return (-nota, game.get('Nome', '').lower())
-        
-        games_data.sort(key=sort_key)
-        notas = [float(str(g.get('Nota', 0)).replace(',', '.')) for g in games_data if g.get('Nota')]
-        tempos_de_jogo = [int(str(g.get('Tempo de Jogo', 0)).replace('h', '')) for g in games_data]
-        
-        base_stats = {
-            'total_jogos': len(games_data), 'total_finalizados': len([g for g in games_data if g.get('Status') in ['Finalizado', 'Platinado']]),
-            'total_platinados': len([g for g in games_data if g.get('Platinado?') == 'Sim']), 'total_avaliados': len([g for g in games_data if g.get('Nota') and float(str(g.get('Nota')).replace(',', '.')) > 0]),
-            'total_horas_jogadas': sum(tempos_de_jogo), 'custo_total_biblioteca': sum([safe_float_conversion(g.get('Preço')) for g in games_data]),
-            'media_notas': sum(notas) / len(notas) if notas else 0, 'total_conquistas': sum([int(g.get('Conquistas Obtidas', 0)) for g in games_data]),
-        }
+        all_price_history_data = sheets_data['Historico de Preços'] or []
+
+        # Ordena só a lista de saída, com as chaves pré-calculadas. A lista em cache fica
+        # na ordem da planilha, que é a base do índice nome -> linha usado nas escritas.
+        # Nota 0 é diferente de sem nota (-1): um jogo avaliado com 0 vem antes dos não avaliados.
+        sort_keys = [
+            (-_safe_float(game.get('Nota', -1), default=-1), str(game.get('Nome', '')).lower())
+            for game in games_data
+        ]
+        sorted_games = [games_data[i] for i in sorted(range(len(games_data)), key=sort_keys.__getitem__)]
+        base_stats, stat_counters = _compute_base_stats(games_data)
 
-        completed_achievements, pending_achievements = _check_achievements(games_data, base_stats, all_achievements, wishlist_data_filtered) 
-        gamer_stats = _calculate_gamer_stats(games_data, completed_achievements)
+        completed_achievements, pending_achievements = _check_achievements(games_data, {**base_stats, **stat_counters}, all_achievements, wishlist_data_filtered) 
+        gamer_stats = _calculate_gamer_stats(stat_counters, completed_achievements)
         final_stats = {**base_stats, **gamer_stats}
 
         for ach in completed_achievements:
@@ -438,62 +911,91 @@ def get_all_game_data():
                             break 
                 except (ValueError, TypeError): continue
        
+        recent_prices_by_game = _group_recent_prices(all_price_history_data)
         for wish in wishlist_data_filtered: 
-            _check_for_promotions(wish, existing_notifications, all_price_history_data)
+            _check_for_promotions(wish, existing_notifications, recent_prices_by_game)
             
-        return {
-            'estatisticas': final_stats, 'biblioteca': games_data, 'desejos': wishlist_data_filtered, 'perfil': profile_data,
+        payload = {
+            'estatisticas': final_stats, 'biblioteca': sorted_games, 'desejos': wishlist_data_filtered, 'perfil': profile_data,
             'conquistas_concluidas': completed_achievements, 'conquistas_pendentes': pending_achievements
         }
+        # Se houve escrita durante a montagem, o payload já nasce desatualizado: não guarda.
+        if _game_data_cache['generation'] == generation:
+            _game_data_cache['payload'] = payload
+            _game_data_cache['updated_at'] = current_cache_time
+        return payload
     except Exception as e:
-        print(f"ERRO CRÍTICO: Erro ao buscar dados na função get_all_game_data: {e}"); traceback.print_exc()
-        return { 'estatisticas': {}, 'biblioteca': [], 'desejos': [], 'perfil': {}, 'conquistas_concluidas': [], 'conquistas_pendentes': [] }
+        logger.exception(f"ERRO CRÍTICO: Erro ao buscar dados na função get_all_game_data: {e}")
+        return None
 
 def get_public_profile_data():
+    return _serve_payload(_public_profile_cache, _build_public_profile_data, "Dados do perfil público", _EMPTY_PUBLIC_PROFILE)
+
+def _build_public_profile_data():
+    current_cache_time = datetime.now()
+    generation = _public_profile_cache['generation']
     try:
-        game_sheet_data = _get_data_from_sheet('Jogos'); games_data = game_sheet_data if game_sheet_data else []
-        wishlist_sheet_data = _get_data_from_sheet('Desejos'); all_wishlist_data = wishlist_sheet_data if wishlist_sheet_data else []
-        profile_sheet_data = _get_data_from_sheet('Perfil'); profile_records = profile_sheet_data if profile_sheet_data else []
+        sheets_data = _get_data_from_sheets(['Jogos', 'Desejos', 'Perfil', 'Conquistas'])
+        games_data = sheets_data['Jogos']
+        # Mesma regra do dashboard: falha na leitura de 'Jogos' não vai para o cache.
+        if games_data is None:
+            print("AVISO: Aba 'Jogos' indisponível; perfil público não será montado nem guardado em cache.")
+            return None
+        all_wishlist_data = sheets_data['Desejos'] or []
+        profile_records = sheets_data['Perfil'] or []
         profile_data = {item['Chave']: item['Valor'] for item in profile_records}
-        achievements_sheet_data = _get_data_from_sheet('Conquistas'); all_achievements = achievements_sheet_data if achievements_sheet_data else []
-        tempos_de_jogo = [int(str(g.get('Tempo de Jogo', 0)).replace('h', '')) for g in games_data]
-        notas = [float(str(g.get('Nota', 0)).replace(',', '.')) for g in games_data if g.get('Nota')]
-
-        base_stats = {
-            'total_jogos': len(games_data), 'total_finalizados': len([g for g in games_data if g.get('Status') in ['Finalizado', 'Platinado']]),
-            'total_platinados': len([g for g in games_data if g.get('Platinado?') == 'Sim']), 'total_avaliados': len([g for g in games_data if g.get('Nota') and float(str(g.get('Nota')).replace(',', '.')) > 0]),
-            'total_horas_jogadas': sum(tempos_de_jogo), 'custo_total_biblioteca': sum([float(str(g.get('Preço', '0,00')).replace('R$', '').replace(',', '.')) for g in games_data]),
-            'media_notas': sum(notas) / len(notas) if notas else 0, 'total_conquistas': sum([int(g.get('Conquistas Obtidas', 0)) for g in games_data]),
-            'WISHLIST_TOTAL': len(all_wishlist_data) 
-        }
+        all_achievements = sheets_data['Conquistas'] or []
+        base_stats, stat_counters = _compute_base_stats(games_data)
+        base_stats['WISHLIST_TOTAL'] = len(all_wishlist_data)
 
-        completed_achievements, _ = _check_achievements(games_data, base_stats, all_achievements, all_wishlist_data)
-        gamer_stats = _calculate_gamer_stats(games_data, completed_achievements)
+        completed_achievements, _ = _check_achievements(games_data, {**base_stats, **stat_counters}, all_achievements, all_wishlist_data)
+        gamer_stats = _calculate_gamer_stats(stat_counters, completed_achievements)
         public_stats = {**base_stats, **gamer_stats}
         
         recent_platinums = sorted([g for g in games_data if g.get('Platinado?') == 'Sim' and g.get('Link')], key=lambda x: x.get('Terminado em', '0000-00-00'), reverse=True)
         
-        return {
+        payload = {
             'perfil': profile_data, 'estatisticas': public_stats, 'ultimos_platinados': recent_platinums[:5]
         }
+        if _public_profile_cache['generation'] == generation:
+            _public_profile_cache['payload'] = payload
+            _public_profile_cache['updated_at'] = current_cache_time
+        return payload
     except Exception as e:
-        print(f"ERRO: Erro ao buscar dados do perfil público: {e}"); traceback.print_exc()
-        return {'perfil': {}, 'estatisticas': {}, 'ultimos_platinados': []}
+        logger.exception(f"ERRO: Erro ao buscar dados do perfil público: {e}")
+        return None
 
 def update_profile_in_sheet(profile_data):
     try:
         sheet = _get_sheet('Perfil')
         if not sheet: return {"success": False, "message": "Conexão com a planilha de perfil falhou."}
+
+        # Uma leitura para localizar as chaves; depois uma escrita em lote para as
+        # existentes e um append_rows para as novas (no lugar de find + update_cell por chave).
+        all_values = sheet.get_all_values()
+        key_col = all_values[0].index('Chave') if all_values and 'Chave' in all_values[0] else 0
+        key_to_row = {}
+        for i, row in enumerate(all_values[1:], start=2):
+            if len(row) > key_col:
+                key_to_row.setdefault(row[key_col], i)
+
+        updates, new_rows = [], []
         for key, value in profile_data.items():
-            try:
-                cell = sheet.find(key)
-                sheet.update_cell(cell.row, cell.col + 1, value)
-            except gspread.exceptions.CellNotFound:
-                sheet.append_row([key, value])
+            row_number = key_to_row.get(key)
+            if row_number:
+                updates.append({'range': gspread.utils.rowcol_to_a1(row_number, key_col + 2), 'values': [[value]]})
+            else:
+                new_rows.append([key, value])
+
+        if updates:
+            # update_cell grava como USER_ENTERED; mantém o mesmo comportamento.
+            sheet.batch_update(updates, value_input_option='USER_ENTERED')
+        if new_rows:
+            sheet.append_rows(new_rows)
         _invalidate_cache('Perfil') 
         return {"success": True, "message": "Perfil atualizado com sucesso."}
     except Exception as e:
-        print(f"Erro ao atualizar perfil: {e}"); traceback.print_exc()
+        logger.exception(f"Erro ao atualizar perfil: {e}")
         return {"success": False, "message": "Erro ao atualizar perfil."}
 
 def trigger_similar_games_scraper(game_title: str):
@@ -525,7 +1027,7 @@ def trigger_similar_games_scraper(game_title: str):
     }
 
     try:
-        response = requests.post(url, headers=headers, json=data)
+        response = requests.post(url, headers=headers, json=data, timeout=_external_timeout)
         
         if response.status_code == 204:
             print(f"SUCESSO: Gatilho da Action de similares disparado para o jogo '{game_title}'.")
@@ -535,151 +1037,267 @@ def trigger_similar_games_scraper(game_title: str):
             return {"success": False, "message": "Falha ao iniciar o scraping de similares."}
             
     except requests.exceptions.RequestException as e:
-        print(f"ERRO de Conexão com a API do GitHub (Similares): {e}")
-        traceback.print_exc()
+        logger.exception(f"ERRO de Conexão com a API do GitHub (Similares): {e}")
         return {"success": False, "message": "Erro de comunicação com o GitHub."}
 
-def add_game_to_sheet(game_data):
+def _get_deepl_translator():
+    """Retorna o cliente DeepL, criado uma única vez (reaproveita a conexão HTTP)."""
+    if _deepl_client['translator'] is None:
+        _deepl_client['translator'] = deepl.Translator(Config.DEEPL_API_KEY)
+    return _deepl_client['translator']
+
+def _translate_to_ptbr(text):
+    """
+    Traduz o texto para PT-BR com o DeepL, guardando o resultado pelo hash do texto
+    original: a mesma descrição (ex.: o jogo adicionado de novo) não é retraduzida.
+    Sem chave configurada ou em caso de erro, devolve o texto original.
+    """
+    if not (Config.DEEPL_API_KEY and text):
+        return text
+    text_hash = hashlib.sha256(text.encode()).hexdigest()
+    cached = _translation_cache.get(text_hash)
+    if cached is not None:
+        return cached
     try:
-        rawg_id = game_data.get('RAWG_ID')
-        if rawg_id and Config.RAWG_API_KEY:
-            try:
-                url = f"https://api.rawg.io/api/games/{rawg_id}?key={Config.RAWG_API_KEY}"
-                response = requests.get(url)
-                if response.ok:
-                    details = response.json()
-                    description = details.get('description_raw', '')
-                    translated_description = description
-                    if Config.DEEPL_API_KEY and description:
-                        try:
-                            translator = deepl.Translator(Config.DEEPL_API_KEY)
-                            result = translator.translate_text(description, target_lang="PT-BR")
-                            translated_description = result.text
-                        except Exception as deepl_e:
-                            print(f"ERRO: Erro ao traduzir com DeepL: {deepl_e}")
-                    game_data['Descricao'] = translated_description
-                    game_data['Metacritic'] = details.get('metacritic', '')
-                    game_data['Screenshots'] = ', '.join([sc.get('image') for sc in details.get('short_screenshots', [])[:3]])
-            except requests.exceptions.RequestException as e:
-                print(f"ERRO: Erro ao buscar detalhes da RAWG para o ID {rawg_id}: {e}")
+        translated = _get_deepl_translator().translate_text(text, target_lang="PT-BR").text
+    except Exception as deepl_e:
+        print(f"ERRO: Erro ao traduzir com DeepL: {deepl_e}")
+        return text
+    if len(_translation_cache) >= _translation_cache_max_size:
+        _translation_cache.clear()
+    _translation_cache[text_hash] = translated
+    return translated
+
+def _get_rawg_details(rawg_id):
+    """
+    Busca os detalhes do jogo na RAWG pela sessão compartilhada, guardando a resposta
+    por RAWG_ID (reabrir a tela de adição ou reenviar o mesmo jogo não refaz a chamada).
+    Retorna None se a RAWG não responder com sucesso.
+    """
+    cache_key = str(rawg_id)
+    now = time.monotonic()
+    cached = _rawg_details_cache.get(cache_key)
+    if cached and now - cached[1] < _rawg_details_cache_ttl_seconds:
+        return cached[0]
+
+    response = _rawg_session.get(
+        f"https://api.rawg.io/api/games/{rawg_id}", params={'key': Config.RAWG_API_KEY}, timeout=_external_timeout
+    )
+    if not response.ok:
+        return None
+    details = response.json()
+    if len(_rawg_details_cache) >= _rawg_details_cache_max_size:
+        _rawg_details_cache.clear()
+    _rawg_details_cache[cache_key] = (details, now)
+    return details
+
+def _fetch_rawg_details(game_data):
+    """Completa descrição (traduzida), Metacritic e screenshots do jogo a partir da RAWG, quando houver RAWG_ID."""
+    rawg_id = game_data.get('RAWG_ID')
+    if not (rawg_id and Config.RAWG_API_KEY):
+        return
+    try:
+        details = _get_rawg_details(rawg_id)
+        if details is not None:
+            description = details.get('description_raw', '')
+            game_data['Descricao'] = _translate_to_ptbr(description)
+            game_data['Metacritic'] = details.get('metacritic', '')
+            game_data['Screenshots'] = ', '.join([sc.get('image') for sc in details.get('short_screenshots', [])[:3]])
+    except requests.exceptions.RequestException as e:
+        print(f"ERRO: Erro ao buscar detalhes da RAWG para o ID {rawg_id}: {e}")
+
+def add_games_to_sheet(games_data):
+    """
+    Adiciona vários jogos de uma vez: todas as linhas vão em um único append_rows
+    (uma chamada à API) em vez de um append_row por jogo.
+    """
+    try:
+        if not games_data:
+            return {"success": False, "message": "Nenhum jogo informado."}
+
+        for game_data in games_data:
+            _fetch_rawg_details(game_data)
 
         sheet = _get_sheet('Jogos')
         if not sheet: return {"success": False, "message": "Conexão com a planilha falhou."}
-        headers = sheet.row_values(1)
-        row_data = [game_data.get(header, '') for header in headers]
-        sheet.append_row(row_data)
+        headers = _get_headers('Jogos', sheet)
+        sheet.append_rows([[game_data.get(header, '') for header in headers] for game_data in games_data])
         _invalidate_cache('Jogos') 
         
-        game_name = game_data.get('Nome')
-        _add_notification("Novo Jogo Adicionado", f"Você adicionou '{game_name}' à sua biblioteca!", link_target=game_name)
-        
-        if game_name:
-            trigger_similar_games_scraper(game_name)
-
-        return {"success": True, "message": "Jogo adicionado com sucesso."}
+        for game_data in games_data:
+            game_name = game_data.get('Nome')
+            _add_notification("Novo Jogo Adicionado", f"Você adicionou '{game_name}' à sua biblioteca!", link_target=game_name)
+            if game_name:
+                trigger_similar_games_scraper(game_name)
+
+        if len(games_data) == 1:
+            return {"success": True, "message": "Jogo adicionado com sucesso."}
+        return {"success": True, "message": f"{len(games_data)} jogos adicionados com sucesso."}
     except Exception as e:
-        print(f"ERRO: Erro ao adicionar jogo: {e}"); traceback.print_exc()
+        logger.exception(f"ERRO: Erro ao adicionar jogo: {e}")
         return {"success": False, "message": "Erro ao adicionar jogo."}
+
+def add_game_to_sheet(game_data):
+    return add_games_to_sheet([game_data])
         
 def add_wish_to_sheet(wish_data):
     try:
         sheet = _get_sheet('Desejos')
         if not sheet: return {"success": False, "message": "Conexão com a planilha falhou."}
-        headers = sheet.row_values(1)
+        headers = _get_headers('Desejos', sheet)
         row_data = {header: wish_data.get(header, '') for header in headers}
         sheet.append_row(list(row_data.values()))
         _invalidate_cache('Desejos') 
         _add_notification("Novo Desejo Adicionado", f"Você adicionou '{wish_data.get('Nome')}' à sua lista de desejos!", link_target=wish_data.get('Nome'))
         return {"success": True, "message": "Item de desejo adicionado com sucesso."}
     except Exception as e:
-        print(f"ERRO: Erro ao adicionar item de desejo: {e}"); traceback.print_exc()
+        logger.exception(f"ERRO: Erro ao adicionar item de desejo: {e}")
         return {"success": False, "message": "Erro ao adicionar item de desejo."}
         
+def _build_row_updates(row_number, headers, updated_data):
+    """
+    Monta os ranges A1 de todas as colunas enviadas em updated_data, juntando colunas
+    vizinhas em um único range (ex.: 'F7:I7' em vez de 'F7', 'G7', 'H7', 'I7').
+    Não compara com o registro em cache: ele pode estar defasado em relação à
+    planilha e a escrita de um valor "igual" seria descartada sem aviso.
+    """
+    columns = [
+        (col, updated_data[header]) for col, header in enumerate(headers, start=1)
+        if header in updated_data
+    ]
+
+    runs = []
+    for col, value in columns:
+        if runs and col == runs[-1][-1][0] + 1:
+            runs[-1].append((col, value))
+        else:
+            runs.append([(col, value)])
+
+    updates = []
+    for run in runs:
+        first_cell = gspread.utils.rowcol_to_a1(row_number, run[0][0])
+        last_cell = gspread.utils.rowcol_to_a1(row_number, run[-1][0])
+        cell_range = first_cell if first_cell == last_cell else f'{first_cell}:{last_cell}'
+        updates.append({'range': cell_range, 'values': [[value for _, value in run]]})
+    return updates
+
 def update_game_in_sheet(game_name, updated_data):
     try:
         sheet = _get_sheet('Jogos')
         if not sheet: return {"success": False, "message": "Conexão com a planilha falhou."}
         
-        try: 
-            cell = sheet.find(game_name)
-        except gspread.exceptions.CellNotFound: 
+        row_number = _find_row_number('Jogos', game_name, sheet)
+        if not row_number:
             return {"success": False, "message": "Jogo não encontrado."}
-        
-        all_records = _get_data_from_sheet('Jogos')
-        normalized_records = [{k.strip(): v for k, v in record.items()} for record in all_records]
-        
-        game_to_update = next((record for record in normalized_records if record.get('Nome') == game_name), None)
 
-        if not game_to_update:
-            return {"success": False, "message": "Erro ao encontrar os dados do jogo para preservar."}
-            
-        merged_data = {**game_to_update, **updated_data}
-
-        headers = [h.strip() for h in sheet.row_values(1)]
-        new_row = [merged_data.get(header, '') for header in headers]
+        headers = [h.strip() for h in _get_headers('Jogos', sheet)]
+        updates = _build_row_updates(row_number, headers, updated_data)
         
-        sheet.update(f'A{cell.row}', [new_row])
+        if updates:
+            sheet.batch_update(updates)
         _invalidate_cache('Jogos') 
+        _similar_games_cache.pop(game_name.lower(), None)
         
         return {"success": True, "message": "Jogo atualizado com sucesso."}
     except Exception as e:
-        print(f"ERRO: Erro ao atualizar jogo: {e}"); traceback.print_exc()
+        logger.exception(f"ERRO: Erro ao atualizar jogo: {e}")
         return {"success": False, "message": "Erro ao atualizar jogo."}
         
-def delete_game_from_sheet(game_name):
+def _delete_rows_in_one_request(sheet, row_numbers):
+    """
+    Remove várias linhas com um único batchUpdate (deleteDimension). As linhas são
+    apagadas de baixo para cima para que uma remoção não desloque as seguintes.
+    """
+    delete_requests = [
+        {'deleteDimension': {'range': {'sheetId': sheet.id, 'dimension': 'ROWS', 'startIndex': row - 1, 'endIndex': row}}}
+        for row in sorted(set(row_numbers), reverse=True)
+    ]
+    sheet.spreadsheet.batch_update({'requests': delete_requests})
+
+def delete_games_from_sheet(game_names):
+    """Remove vários jogos da biblioteca em uma única chamada à API do Sheets."""
     try:
+        if not game_names:
+            return {"success": False, "message": "Nenhum jogo informado."}
         sheet = _get_sheet('Jogos')
         if not sheet: return {"success": False, "message": "Conexão com a planilha falhou."}
-        cell = sheet.find(game_name)
-        sheet.delete_rows(cell.row)
+
+        # Linhas conferidas na planilha (não só no cache) antes do deleteDimension,
+        # que é irreversível: um índice defasado apagaria outro jogo.
+        rows_by_name = _find_row_numbers('Jogos', game_names, sheet)
+        if not rows_by_name:
+            return {"success": False, "message": "Jogo não encontrado."}
+
+        _delete_rows_in_one_request(sheet, rows_by_name.values())
         _invalidate_cache('Jogos') 
-        _add_notification("Jogo Removido", f"O jogo '{game_name}' foi removido da sua biblioteca.", link_target=game_name)
-        return {"success": True, "message": "Jogo deletado com sucesso."}
+        for game_name in rows_by_name:
+            _similar_games_cache.pop(game_name.lower(), None)
+            _add_notification("Jogo Removido", f"O jogo '{game_name}' foi removido da sua biblioteca.", link_target=game_name)
+
+        if len(game_names) == 1:
+            return {"success": True, "message": "Jogo deletado com sucesso."}
+        not_found = [game_name for game_name in game_names if game_name not in rows_by_name]
+        message = f"{len(rows_by_name)} jogos deletados com sucesso."
+        if not_found:
+            message += f" Não encontrados: {', '.join(not_found)}."
+        return {"success": True, "message": message}
     except gspread.exceptions.CellNotFound:
         return {"success": False, "message": "Jogo não encontrado."}
     except Exception as e:
-        print(f"ERRO: Erro ao deletar jogo: {e}"); traceback.print_exc()
+        logger.exception(f"ERRO: Erro ao deletar jogo: {e}")
         return {"success": False, "message": "Erro ao deletar jogo."}
+
+def delete_game_from_sheet(game_name):
+    return delete_games_from_sheet([game_name])
         
 def update_wish_in_sheet(wish_name, updated_data):
     try:
         sheet = _get_sheet('Desejos')
         if not sheet: return {"success": False, "message": "Conexão com a planilha falhou."}
-        cell = sheet.find(wish_name)
-        headers = sheet.row_values(1)
-        new_row = [updated_data.get(header, '') for header in headers]
-        sheet.update(f'A{cell.row}', [new_row])
+        row_number = _find_row_number('Desejos', wish_name, sheet)
+        if not row_number:
+            return {"success": False, "message": "Item de desejo não encontrado."}
+
+        headers = [h.strip() for h in _get_headers('Desejos', sheet)]
+        updates = _build_row_updates(row_number, headers, updated_data)
+
+        if updates:
+            sheet.batch_update(updates)
         _invalidate_cache('Desejos') 
         return {"success": True, "message": "Item de desejo atualizado com sucesso."}
     except gspread.exceptions.CellNotFound:
         return {"success": False, "message": "Item de desejo não encontrado."}
     except Exception as e:
-        print(f"ERRO: Erro ao atualizar item de desejo: {e}"); traceback.print_exc()
+        logger.exception(f"ERRO: Erro ao atualizar item de desejo: {e}")
         return {"success": False, "message": "Erro ao atualizar item de desejo."}
 
 def delete_wish_from_sheet(wish_name):
     try:
         sheet = _get_sheet('Desejos')
         if not sheet: return {"success": False, "message": "Conexão com a planilha falhou."}
-        cell = sheet.find(wish_name)
-        sheet.delete_rows(cell.row)
+        row_number = _find_row_number('Desejos', wish_name, sheet)
+        if not row_number:
+            return {"success": False, "message": "Item de desejo não encontrado."}
+        sheet.delete_rows(row_number)
         _invalidate_cache('Desejos') 
         _add_notification("Desejo Removido", f"O item '{wish_name}' foi removido da sua lista de desejos.", link_target=wish_name)
         return {"success": True, "message": "Item de desejo deletado com sucesso."}
     except gspread.exceptions.CellNotFound:
         return {"success": False, "message": "Item de desejo não encontrado."}
     except Exception as e:
-        print(f"ERRO: Erro ao deletar item de desejo: {e}"); traceback.print_exc()
+        logger.exception(f"ERRO: Erro ao deletar item de desejo: {e}")
         return {"success": False, "message": "Erro ao deletar item de desejo."}
 
 def purchase_wish_item_in_sheet(item_name):
     try:
         sheet = _get_sheet('Desejos')
         if not sheet: return {"success": False, "message": "Conexão com a planilha falhou."}
-        cell = sheet.find(item_name)
-        headers = sheet.row_values(1)
+        row_number = _find_row_number('Desejos', item_name, sheet)
+        if not row_number:
+            return {"success": False, "message": "Item de desejo não encontrado."}
+        headers = _get_headers('Desejos', sheet)
         status_col_index = headers.index('Status') + 1
-        sheet.update_cell(cell.row, status_col_index, 'Comprado')
+        sheet.update_cell(row_number, status_col_index, 'Comprado')
         _invalidate_cache('Desejos') 
         _add_notification("Desejo Comprado", f"Você marcou '{item_name}' como comprado! Aproveite o jogo!", link_target=item_name)
         return {"success": True, "message": "Item marcado como comprado!"}
@@ -688,7 +1306,7 @@ def purchase_wish_item_in_sheet(item_name):
     except ValueError:
         return {"success": False, "message": "Coluna 'Status' não encontrada."}
     except Exception as e:
-        print(f"ERRO: Erro ao marcar item como comprado: {e}"); traceback.print_exc()
+        logger.exception(f"ERRO: Erro ao marcar item como comprado: {e}")
         return {"success": False, "message": "Erro ao processar a compra."}
 
 def trigger_wishlist_scraper_action():
@@ -704,7 +1322,7 @@ def trigger_wishlist_scraper_action():
         url = f'https://api.github.com/repos/{repo_owner}/{repo_name}/actions/workflows/{workflow_file}/dispatches'
         headers = {'Accept': 'application/vnd.github.com+json', 'Authorization': f'token {github_pat}'}
         data = { 'ref': 'main' }
-        response = requests.post(url, headers=headers, json=data)
+        response = requests.post(url, headers=headers, json=data, timeout=_external_timeout)
         
         if response.status_code == 204:
             return {"success": True, "message": "Atualização de preços iniciada com sucesso!"}
@@ -714,6 +1332,8 @@ def trigger_wishlist_scraper_action():
         return {"success": False, "message": f"Erro: {e}"}
 
 def get_random_game(plataforma=None, estilo=None, metacritic_min=None, metacritic_max=None):
+    # Import local: o pandas (e o numpy) só é carregado quando o sorteio é usado.
+    import pandas as pd
     try:
         games_data = _get_data_from_sheet('Jogos')
         if not games_data: return None
@@ -738,7 +1358,7 @@ def get_random_game(plataforma=None, estilo=None, metacritic_min=None, metacriti
         
         return None
     except Exception as e:
-        print(f"ERRO na função get_random_game: {e}"); traceback.print_exc()
+        logger.exception(f"ERRO na função get_random_game: {e}")
         return None
 
 def get_image_for_game(game_info):
@@ -749,8 +1369,11 @@ def get_image_for_game(game_info):
     
     print(f"[API THREAD] Buscando imagem para '{game_name_to_search}'...")
     try:
-        search_url = f"https://api.rawg.io/api/games?key={Config.RAWG_API_KEY}&search={requests.utils.quote(game_name_to_search)}&page_size=1"
-        response = requests.get(search_url, timeout=10)
+        response = _rawg_session.get(
+            "https://api.rawg.io/api/games",
+            params={'key': Config.RAWG_API_KEY, 'search': game_name_to_search, 'page_size': 1},
+            timeout=_external_timeout,
+        )
         response.raise_for_status()
         search_data = response.json()
         
@@ -767,6 +1390,12 @@ def get_similar_games_from_sheet(base_game_name: str):
     Busca jogos similares na planilha. Se algum não tiver imagem, busca na API da RAWG
     de forma concorrente e atualiza a planilha antes de retornar os dados.
     """
+    cache_key = base_game_name.lower()
+    cached = _similar_games_cache.get(cache_key)
+    if cached and (datetime.now() - cached[1]).total_seconds() < _cache_ttl_seconds:
+        print(f"DEBUG: Jogos similares de '{base_game_name}' servidos do cache.")
+        return cached[0]
+
     try:
         similar_sheet = _get_sheet('Jogos Similares')
         if not similar_sheet: return []
@@ -817,11 +1446,13 @@ def get_similar_games_from_sheet(base_game_name: str):
                 similar_sheet.batch_update(updates_to_perform, value_input_option='USER_ENTERED')
                 _invalidate_cache('Jogos Similares')
 
+        # Lista vazia não vai para o cache: o scraper de similares pode ainda estar rodando.
+        if games_for_frontend:
+            _similar_games_cache[cache_key] = (games_for_frontend, datetime.now())
         return games_for_frontend
 
     except Exception as e:
-        print(f"!!! ERRO GERAL em get_similar_games_from_sheet: {e}")
-        traceback.print_exc()
+        logger.exception(f"!!! ERRO GERAL em get_similar_games_from_sheet: {e}")
         return []
 
 # Em services/game_service.py, adicione estas duas funções no final do arquivo
@@ -835,116 +1466,8 @@ def get_steam_library():
         return {"error": "Credenciais da Steam não configuradas no servidor."}
 
     try:
-        print("--- INICIANDO SINCRONIZAÇÃO COM A STEAM ---") # Log de início
         steam_url = f"http://api.steampowered.com/IPlayerService/GetOwnedGames/v0001/?key={Config.STEAM_API_KEY}&steamid={Config.STEAM_USER_ID}&format=json&include_appinfo=true"
-        response = requests.get(steam_url)
-        response.raise_for_status()
-        steam_games_raw = response.json().get('response', {}).get('games', [])
-        
-        steam_games_filtered = [game for game in steam_games_raw if game.get('playtime_forever', 0) > 0]
-        print(f"DEBUG: Encontrados {len(steam_games_filtered)} jogos jogados na Steam.")
-
-        library_games = _get_data_from_sheet('Jogos')
-        print(f"DEBUG: Encontrados {len(library_games)} jogos na planilha.")
-
-        # Cria um mapa com os nomes normalizados para comparação
-        library_map = {_normalize_name(game.get('Nome')): game for game in library_games}
-        
-        # Log de exemplo da normalização da planilha
-        if library_games:
-            example_game = library_games[0]
-            print(f"DEBUG: Exemplo de normalização da planilha:")
-            print(f"  -> Original: '{example_game.get('Nome')}'")
-            print(f"  -> Normalizado: '{_normalize_name(example_game.get('Nome'))}'")
-
-
-        new_games = []
-        games_to_update = []
-
-        def enrich_game_data(game):
-            appid = game['appid']
-            name = game['name']
-            playtime_hours = round(game.get('playtime_forever', 0) / 60)
-            
-            achievements_count = 0
-            is_platinum = False
-            try:
-                ach_url = f"http://api.steampowered.com/ISteamUserStats/GetPlayerAchievements/v0001/?appid={appid}&key={Config.STEAM_API_KEY}&steamid={Config.STEAM_USER_ID}"
-                ach_response = requests.get(ach_url, timeout=5).json()
-                if ach_response.get('playerstats', {}).get('success') and 'achievements' in ach_response['playerstats']:
-                    all_achievements = ach_response['playerstats']['achievements']
-                    total_achievements = len(all_achievements)
-                    unlocked_achievements = [ach for ach in all_achievements if ach.get('achieved') == 1]
-                    achievements_count = len(unlocked_achievements)
-                    if total_achievements > 0 and achievements_count == total_achievements:
-                        is_platinum = True
-            except Exception:
-                pass 
-
-            game_payload = {
-                'name': name,
-                'playtime_steam': f"{playtime_hours}h",
-                'achievements_steam': achievements_count,
-                'appid': appid,
-                'cover_image': f"https://steamcdn-a.akamaihd.net/steam/apps/{appid}/header.jpg",
-                'is_platinum': is_platinum
-            }
-
-            # A comparação inteligente é feita aqui
-            normalized_steam_name = _normalize_name(name)
-            
-            # Log de depuração principal
-            print(f"\n--- Comparando Jogo: '{name}' ---")
-            print(f"  -> Nome normalizado da Steam: '{normalized_steam_name}'")
-
-            if normalized_steam_name in library_map:
-                existing_game = library_map[normalized_steam_name]
-                print(f"  -> Jogo ENCONTRADO na planilha como: '{existing_game.get('Nome')}'")
-                print("  -> Resultado: MARCADO PARA ATUALIZAR")
-                game_payload['name'] = existing_game.get('Nome') 
-                game_payload['playtime_local'] = f"{existing_game.get('Tempo de Jogo', 0)}h"
-                game_payload['achievements_local'] = existing_game.get('Conquistas Obtidas', 0)
-                return 'update', game_payload
-            else:
-                print(f"  -> Jogo NÃO encontrado na planilha.")
-                print("  -> Resultado: MARCADO COMO NOVO")
-                return 'new', game_payload
-
-        with ThreadPoolExecutor(max_workers=20) as executor:
-            futures = [executor.submit(enrich_game_data, game) for game in steam_games_filtered]
-            for future in as_completed(futures):
-                result_type, payload = future.result()
-                if result_type == 'new':
-                    new_games.append(payload)
-                else:
-                    games_to_update.append(payload)
-
-        new_games.sort(key=lambda x: x['name'])
-        games_to_update.sort(key=lambda x: x['name'])
-        
-        print("--- SINCRONIZAÇÃO CONCLUÍDA ---")
-        return {"new_games": new_games, "games_to_update": games_to_update}
-
-    except requests.exceptions.RequestException as e:
-        return {"error": f"Falha ao comunicar com a API da Steam: {e}"}
-    except Exception as e:
-        traceback.print_exc()
-        return {"error": "Ocorreu um erro interno ao processar a biblioteca da Steam."}
-
-
-# Em services/game_service.py, adicione estas duas funções no final do arquivo
-
-def get_steam_library():
-    """
-    Busca a biblioteca de jogos da Steam, enriquecendo com conquistas e capas,
-    compara com a planilha e retorna uma lista de jogos novos e a serem atualizados.
-    """
-    if not Config.STEAM_API_KEY or not Config.STEAM_USER_ID:
-        return {"error": "Credenciais da Steam não configuradas no servidor."}
-
-    try:
-        steam_url = f"http://api.steampowered.com/IPlayerService/GetOwnedGames/v0001/?key={Config.STEAM_API_KEY}&steamid={Config.STEAM_USER_ID}&format=json&include_appinfo=true"
-        response = requests.get(steam_url)
+        response = _steam_session.get(steam_url, timeout=(3.05, 15))
         response.raise_for_status()
         steam_games_raw = response.json().get('response', {}).get('games', [])
         
@@ -966,7 +1489,7 @@ def get_steam_library():
             is_platinum = False # <-- NOVA VARIÁVEL
             try:
                 ach_url = f"http://api.steampowered.com/ISteamUserStats/GetPlayerAchievements/v0001/?appid={appid}&key={Config.STEAM_API_KEY}&steamid={Config.STEAM_USER_ID}"
-                ach_response = requests.get(ach_url, timeout=5).json()
+                ach_response = _steam_session.get(ach_url, timeout=5).json()
                 if ach_response.get('playerstats', {}).get('success') and 'achievements' in ach_response['playerstats']:
                     all_achievements = ach_response['playerstats']['achievements']
                     total_achievements = len(all_achievements)
@@ -1017,7 +1540,7 @@ def get_steam_library():
     except requests.exceptions.RequestException as e:
         return {"error": f"Falha ao comunicar com a API da Steam: {e}"}
     except Exception as e:
-        traceback.print_exc()
+        logger.exception(f"ERRO em get_steam_library: {e}")
         return {"error": "Ocorreu um erro interno ao processar a biblioteca da Steam."}
 
 
@@ -1031,10 +1554,10 @@ def sync_steam_games(games_to_sync):
         sheet = _get_sheet('Jogos')
         if not sheet: return {"success": False, "message": "Conexão com a planilha falhou."}
         
-        all_library_games = sheet.get_all_records()
-        library_map = {game.get('Nome').lower(): game for game in all_library_games}
+        all_library_games = _get_data_from_sheet('Jogos')
+        library_map = {str(game.get('Nome', '')).lower(): game for game in all_library_games}
         
-        added_count = 0
+        new_games = []
         updated_count = 0
 
         for game in games_to_sync:
@@ -1048,26 +1571,20 @@ def sync_steam_games(games_to_sync):
 
             if Config.RAWG_API_KEY:
                 try:
-                    search_url = f"https://api.rawg.io/api/games?key={Config.RAWG_API_KEY}&search={requests.utils.quote(game_name)}&page_size=1"
-                    rawg_response = requests.get(search_url).json().get('results', [])
-                    if rawg_response:
-                        rawg_id = rawg_response[0].get('id')
-                        details_url = f"https://api.rawg.io/api/games/{rawg_id}?key={Config.RAWG_API_KEY}"
-                        details_response = requests.get(details_url).json()
-                        
+                    rawg_response = _rawg_session.get(
+                        "https://api.rawg.io/api/games",
+                        params={'key': Config.RAWG_API_KEY, 'search': game_name, 'page_size': 1},
+                        timeout=_external_timeout,
+                    ).json().get('results', [])
+                    rawg_id = rawg_response[0].get('id') if rawg_response else None
+                    details_response = _get_rawg_details(rawg_id) if rawg_id else None
+                    if details_response:
                         # Tenta pegar a imagem da RAWG. Se conseguir, ela se torna a imagem final.
                         rawg_image = details_response.get('background_image')
                         if rawg_image:
                             final_cover_image = rawg_image
 
-                        description = details_response.get('description_raw', '')
-                        translated_description = description
-                        if Config.DEEPL_API_KEY and description:
-                            try:
-                                translator = deepl.Translator(Config.DEEPL_API_KEY)
-                                result = translator.translate_text(description, target_lang="PT-BR")
-                                translated_description = result.text
-                            except Exception: pass
+                        translated_description = _translate_to_ptbr(details_response.get('description_raw', ''))
 
                         rawg_data = {
                             'RAWG_ID': rawg_id,
@@ -1103,12 +1620,16 @@ def sync_steam_games(games_to_sync):
                     'Preço': 0,
                     **rawg_data
                 }
-                add_game_to_sheet(new_game_data)
-                added_count += 1
+                new_games.append(new_game_data)
+
+        # Todos os jogos novos entram em um único append_rows.
+        if new_games:
+            add_games_to_sheet(new_games)
+        added_count = len(new_games)
         
         _invalidate_cache('Jogos')
         return {"success": True, "message": f"{added_count} jogos adicionados e {updated_count} atualizados com sucesso!"}
 
     except Exception as e:
-        print(f"ERRO em sync_steam_games: {e}"); traceback.print_exc()
+        logger.exception(f"ERRO em sync_steam_games: {e}")
         return {"success": False, "message": "Ocorreu um erro durante a sincronização."}
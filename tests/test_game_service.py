@@ -0,0 +1,135 @@
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+# Requer as dependências de requirements-dev.txt (pip install -r requirements-dev.txt).
+from services import game_service
+
+
+@pytest.fixture
+def jogos_sheet(monkeypatch):
+    """Aba 'Jogos' falsa, com índice de linhas limpo e invalidação registrada."""
+    sheet = MagicMock()
+    sheet.title = 'Jogos'
+    sheet.id = 0
+    invalidated = []
+    monkeypatch.setattr(game_service, '_row_index_cache', {})
+    monkeypatch.setattr(game_service, '_get_headers', lambda sheet_name, sheet: ['Nome', 'Status'])
+    monkeypatch.setattr(game_service, '_invalidate_cache', invalidated.append)
+    monkeypatch.setattr(game_service, '_get_data_from_sheet', lambda sheet_name: [{'Nome': 'A'}, {'Nome': 'B'}])
+    sheet.invalidated = invalidated
+    return sheet
+
+
+def test_records_from_values_pads_short_rows():
+    values = [['Nome', 'Nota', 'Status'], ['A', '8'], ['B', '9', 'Finalizado']]
+
+    records = game_service._records_from_values(values)
+
+    assert records == [
+        {'Nome': 'A', 'Nota': 8, 'Status': ''},
+        {'Nome': 'B', 'Nota': 9, 'Status': 'Finalizado'},
+    ]
+
+
+def test_records_from_values_empty_sheet():
+    assert game_service._records_from_values([]) == []
+    assert game_service._records_from_values([['Nome', 'Nota']]) == []
+
+
+def test_build_row_updates_coalesces_adjacent_columns():
+    headers = ['Nome', 'Plataforma', 'Nota', 'Status', 'Preço']
+    updated_data = {'Preço': 10, 'Plataforma': 'PC', 'Nota': 9, 'Coluna Inexistente': 'x'}
+
+    updates = game_service._build_row_updates(7, headers, updated_data)
+
+    assert updates == [
+        {'range': 'B7:C7', 'values': [['PC', 9]]},
+        {'range': 'E7', 'values': [[10]]},
+    ]
+
+
+def test_delete_rows_in_one_request_deletes_bottom_up():
+    sheet = MagicMock()
+    sheet.id = 42
+
+    game_service._delete_rows_in_one_request(sheet, [3, 10, 5, 10])
+
+    body = sheet.spreadsheet.batch_update.call_args.args[0]
+    ranges = [request['deleteDimension']['range'] for request in body['requests']]
+    assert [(r['startIndex'], r['endIndex']) for r in ranges] == [(9, 10), (4, 5), (2, 3)]
+    assert all(r['sheetId'] == 42 and r['dimension'] == 'ROWS' for r in ranges)
+
+
+def test_find_row_number_uses_cached_row_when_live_cell_matches(jogos_sheet):
+    jogos_sheet.spreadsheet.values_batch_get.return_value = {'valueRanges': [{'values': [['B']]}]}
+
+    assert game_service._find_row_number('Jogos', 'B', jogos_sheet) == 3
+
+    jogos_sheet.spreadsheet.values_batch_get.assert_called_once_with(["'Jogos'!A3"])
+    jogos_sheet.find.assert_not_called()
+    assert jogos_sheet.invalidated == []
+
+
+def test_find_row_number_falls_back_to_find_when_live_cell_differs(jogos_sheet):
+    # Uma linha foi inserida na planilha: a linha 3 agora é de outro jogo.
+    jogos_sheet.spreadsheet.values_batch_get.return_value = {'valueRanges': [{'values': [['Novo Jogo']]}]}
+    jogos_sheet.find.return_value = MagicMock(row=4)
+
+    assert game_service._find_row_number('Jogos', 'B', jogos_sheet) == 4
+
+    jogos_sheet.find.assert_called_once_with('B', in_column=1)
+    assert jogos_sheet.invalidated == ['Jogos']
+
+
+def test_find_row_number_returns_none_when_item_is_gone(jogos_sheet):
+    jogos_sheet.spreadsheet.values_batch_get.return_value = {'valueRanges': [{}]}
+    jogos_sheet.find.return_value = None
+
+    assert game_service._find_row_number('Jogos', 'B', jogos_sheet) is None
+
+
+def test_delete_games_never_deletes_an_unverified_row(jogos_sheet, monkeypatch):
+    monkeypatch.setattr(game_service, '_get_sheet', lambda sheet_name: jogos_sheet)
+    monkeypatch.setattr(game_service, '_add_notification', lambda *args, **kwargs: None)
+    jogos_sheet.spreadsheet.values_batch_get.return_value = {'valueRanges': [{'values': [['Outro Jogo']]}]}
+    jogos_sheet.find.return_value = None
+
+    result = game_service.delete_games_from_sheet(['B'])
+
+    assert result == {"success": False, "message": "Jogo não encontrado."}
+    jogos_sheet.spreadsheet.batch_update.assert_not_called()
+
+
+def test_read_sheet_data_reports_failure_as_none(monkeypatch):
+    monkeypatch.setattr(game_service, '_data_cache', {})
+    monkeypatch.setattr(game_service, '_get_sheet', lambda sheet_name: None)
+
+    assert game_service._read_sheet_data('Jogos') is None
+    assert game_service._get_data_from_sheet('Jogos') == []
+
+
+def test_serve_payload_keeps_previous_payload_when_rebuild_fails():
+    previous = {'estatisticas': {'total_jogos': 3}}
+    payload_cache = {
+        'payload': previous, 'generation': 0, 'lock': threading.Lock(), 'refreshing': threading.Lock(),
+        'updated_at': datetime.now() - timedelta(seconds=3 * game_service._cache_ttl_seconds),
+    }
+
+    served = game_service._serve_payload(payload_cache, lambda: None, 'Teste', game_service._EMPTY_GAME_DATA)
+
+    assert served is previous
+    assert payload_cache['payload'] is previous
+
+
+def test_serve_payload_returns_empty_shape_without_previous_payload():
+    payload_cache = {
+        'payload': None, 'updated_at': datetime.min, 'generation': 0,
+        'lock': threading.Lock(), 'refreshing': threading.Lock(),
+    }
+
+    served = game_service._serve_payload(payload_cache, lambda: None, 'Teste', game_service._EMPTY_PUBLIC_PROFILE)
+
+    assert served == game_service._EMPTY_PUBLIC_PROFILE
@@ -0,0 +1,29 @@
+import decimal
+
+import orjson
+from flask.json.provider import JSONProvider
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+
+
+def _default(obj):
+    """Converte tipos que o orjson não serializa nativamente."""
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONProvider(JSONProvider):
+    """
+    Provider de JSON do Flask baseado no orjson (implementado em C), usado por
+    todos os jsonify() e pelo parse do corpo das requisições.
+    As chaves continuam ordenadas, como no provider padrão do Flask.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)